@@ -14,17 +14,19 @@ namespace MultiRoomAudio.Audio;
 public class BackendFactory
 {
     private readonly ILogger<BackendFactory> _logger;
-    private readonly IBackend _backend;
+    private readonly Lazy<IBackend> _backend;
 
     /// <summary>
     /// The active audio backend.
+    /// Created on first use so startup doesn't pay for backend initialization
+    /// until something actually needs audio.
     /// </summary>
-    public IBackend Backend => _backend;
+    public IBackend Backend => _backend.Value;
 
     /// <summary>
     /// Name of the active backend (always "pulse").
     /// </summary>
-    public string BackendName => _backend.Name;
+    public string BackendName => Backend.Name;
 
     public BackendFactory(
         ILogger<BackendFactory> logger,
@@ -35,11 +37,27 @@ public class BackendFactory
         MockHardwareConfigService? mockConfigService = null)
     {
         _logger = logger;
+        _backend = new Lazy<IBackend>(
+            () => CreateBackend(environment, loggerFactory, volumeRunner, customSinksService, mockConfigService),
+            LazyThreadSafetyMode.ExecutionAndPublication);
+    }
+
+    /// <summary>
+    /// Creates the backend for the current environment.
+    /// </summary>
+    private IBackend CreateBackend(
+        EnvironmentService environment,
+        ILoggerFactory loggerFactory,
+        Utilities.VolumeCommandRunner volumeRunner,
+        CustomSinksService? customSinksService,
+        MockHardwareConfigService? mockConfigService)
+    {
+        IBackend backend;
 
         if (environment.IsMockHardware)
         {
             _logger.LogInformation("Initializing mock audio backend (MOCK_HARDWARE mode)");
-            _backend = new MockAudioBackend(
+            backend = new MockAudioBackend(
                 loggerFactory.CreateLogger<MockAudioBackend>(),
                 customSinksService,
                 mockConfigService);
@@ -47,12 +65,13 @@ public class BackendFactory
         else
         {
             _logger.LogInformation("Initializing PulseAudio backend");
-            _backend = new PulseAudioBackend(
+            backend = new PulseAudioBackend(
                 loggerFactory.CreateLogger<PulseAudioBackend>(),
                 volumeRunner);
         }
 
-        _logger.LogInformation("Audio backend: {Backend}", _backend.Name);
+        _logger.LogInformation("Audio backend: {Backend}", backend.Name);
+        return backend;
     }
 
     /// <summary>
@@ -60,7 +79,7 @@ public class BackendFactory
     /// </summary>
     public IEnumerable<AudioDevice> GetOutputDevices()
     {
-        return _backend.GetOutputDevices();
+        return Backend.GetOutputDevices();
     }
 
     /// <summary>
@@ -68,7 +87,7 @@ public class BackendFactory
     /// </summary>
     public AudioDevice? GetDevice(string deviceId)
     {
-        return _backend.GetDevice(deviceId);
+        return Backend.GetDevice(deviceId);
     }
 
     /// <summary>
@@ -76,7 +95,7 @@ public class BackendFactory
     /// </summary>
     public AudioDevice? GetDefaultDevice()
     {
-        return _backend.GetDefaultDevice();
+        return Backend.GetDefaultDevice();
     }
 
     /// <summary>
@@ -84,7 +103,7 @@ public class BackendFactory
     /// </summary>
     public bool ValidateDevice(string? deviceId, out string? errorMessage)
     {
-        return _backend.ValidateDevice(deviceId, out errorMessage);
+        return Backend.ValidateDevice(deviceId, out errorMessage);
     }
 
     /// <summary>
@@ -92,7 +111,7 @@ public class BackendFactory
     /// </summary>
     public void RefreshDevices()
     {
-        _backend.RefreshDevices();
+        Backend.RefreshDevices();
     }
 
     /// <summary>
@@ -100,7 +119,7 @@ public class BackendFactory
     /// </summary>
     public DeviceCapabilities? GetDeviceCapabilities(string? deviceId)
     {
-        return _backend.GetDeviceCapabilities(deviceId);
+        return Backend.GetDeviceCapabilities(deviceId);
     }
 
     /// <summary>
@@ -109,7 +128,7 @@ public class BackendFactory
     /// </summary>
     public Sendspin.SDK.Audio.IAudioPlayer CreatePlayer(string? deviceId, ILoggerFactory loggerFactory)
     {
-        return _backend.CreatePlayer(deviceId, loggerFactory);
+        return Backend.CreatePlayer(deviceId, loggerFactory);
     }
 
     /// <summary>
@@ -117,6 +136,6 @@ public class BackendFactory
     /// </summary>
     public Task<bool> SetVolumeAsync(string? deviceId, int volume, CancellationToken cancellationToken = default)
     {
-        return _backend.SetVolumeAsync(deviceId, volume, cancellationToken);
+        return Backend.SetVolumeAsync(deviceId, volume, cancellationToken);
     }
 }
@@ -137,13 +137,21 @@ public static class MockCardEnumerator
     /// </summary>
     public static List<string> GetSinksByCard(int cardIndex)
     {
-        var config = GetCardConfigs().FirstOrDefault(c => c.Index == cardIndex);
-        if (config == null)
-            return new List<string>();
+        return GetSinksGroupedByCard().GetValueOrDefault(cardIndex) ?? new List<string>();
+    }
 
-        // Return the corresponding mock sink name
-        var sinkId = config.Name.Replace("alsa_card.", "mock_");
-        return new List<string> { sinkId };
+    /// <summary>
+    /// Gets the sink names of every card, keyed by card index.
+    /// </summary>
+    public static Dictionary<int, List<string>> GetSinksGroupedByCard()
+    {
+        var result = new Dictionary<int, List<string>>();
+        foreach (var config in GetCardConfigs())
+        {
+            // First config wins for a repeated index; each card maps to its mock sink name
+            result.TryAdd(config.Index, new List<string> { config.Name.Replace("alsa_card.", "mock_") });
+        }
+        return result;
     }
 
     /// <summary>
@@ -95,13 +95,12 @@ public class MockPaModuleRunner : IPaModuleRunner
 
     public Task<bool> UnloadModuleAsync(int moduleIndex, CancellationToken cancellationToken = default)
     {
-        if (!_modules.TryGetValue(moduleIndex, out var module))
+        if (!_modules.Remove(moduleIndex, out var module))
         {
             _logger.LogWarning("Mock: Module {Index} not found", moduleIndex);
             return Task.FromResult(false);
         }
 
-        _modules.Remove(moduleIndex);
         _sinkToModule.Remove(module.SinkName);
 
         _logger.LogInformation("Mock: Unloaded module {Index} (sink '{SinkName}')", moduleIndex, module.SinkName);
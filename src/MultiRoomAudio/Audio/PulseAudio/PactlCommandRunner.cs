@@ -1,5 +1,7 @@
+using System.Buffers;
 using System.Diagnostics;
 using System.Text.RegularExpressions;
+using MultiRoomAudio.Utilities;
 
 namespace MultiRoomAudio.Audio.PulseAudio;
 
@@ -46,9 +48,16 @@ public static partial class PactlCommandRunner
 
     /// <summary>
     /// Characters that are dangerous in shell commands and must be rejected.
+    /// SearchValues gives a vectorized membership test instead of scanning a char array.
     /// </summary>
-    private static readonly char[] DangerousChars =
-        [';', '&', '|', '$', '`', '(', ')', '{', '}', '[', ']', '<', '>', '!', '\\', '"', '\'', '\n', '\r', '\0'];
+    private static readonly SearchValues<char> DangerousChars =
+        SearchValues.Create(";&|$`(){}[]<>!\\\"'\n\r\0");
+
+    /// <summary>
+    /// Absolute path of the pactl executable, resolved from PATH once.
+    /// Process.Start otherwise repeats the PATH search (a stat per entry) on every spawn.
+    /// </summary>
+    public static string PactlPath { get; } = ExecutableLocator.Find("pactl") ?? "pactl";
 
     /// <summary>
     /// Configures the logger for command execution diagnostics.
@@ -75,7 +84,7 @@ public static partial class PactlCommandRunner
         }
 
         // Check for dangerous shell metacharacters
-        if (name.IndexOfAny(DangerousChars) >= 0)
+        if (name.AsSpan().ContainsAny(DangerousChars))
         {
             errorMessage = "Name contains invalid characters.";
             return false;
@@ -132,6 +141,91 @@ public static partial class PactlCommandRunner
         return result.Success ? result.Output : null;
     }
 
+    /// <summary>
+    /// Run several independent pactl commands side by side, returning each one's output
+    /// (null on failure) in argument order.
+    /// </summary>
+    /// <remarks>
+    /// The processes are started directly and share one exit deadline, so the calling thread
+    /// blocks only on pactl itself, never on thread-pool work. Any command that fails this
+    /// way is retried through <see cref="Run"/>.
+    /// </remarks>
+    public static string?[] RunConcurrently(params string[] argumentSets)
+    {
+        var processes = new Process?[argumentSets.Length];
+        var outputTasks = new Task<string>?[argumentSets.Length];
+        var errorTasks = new Task<string>?[argumentSets.Length];
+        var results = new string?[argumentSets.Length];
+
+        try
+        {
+            for (int i = 0; i < argumentSets.Length; i++)
+            {
+                try
+                {
+                    var psi = new ProcessStartInfo
+                    {
+                        FileName = PactlPath,
+                        Arguments = argumentSets[i],
+                        RedirectStandardOutput = true,
+                        RedirectStandardError = true,
+                        UseShellExecute = false,
+                        CreateNoWindow = true
+                    };
+
+                    var process = Process.Start(psi);
+                    if (process == null)
+                        continue;
+
+                    processes[i] = process;
+                    // Drain both pipes so neither can fill up and stall pactl
+                    outputTasks[i] = process.StandardOutput.ReadToEndAsync();
+                    errorTasks[i] = process.StandardError.ReadToEndAsync();
+                }
+                catch (Exception ex)
+                {
+                    _logger?.LogDebug(ex, "Failed to start pactl {Args}", argumentSets[i]);
+                }
+            }
+
+            var deadline = Environment.TickCount64 + DefaultTimeoutMs;
+            for (int i = 0; i < argumentSets.Length; i++)
+            {
+                var process = processes[i];
+                if (process == null)
+                    continue;
+
+                var remainingMs = (int)Math.Max(0, deadline - Environment.TickCount64);
+                if (WaitForExitOrKill(process, remainingMs) && process.ExitCode == 0)
+                {
+                    results[i] = outputTasks[i]!.GetAwaiter().GetResult();
+                }
+            }
+        }
+        finally
+        {
+            for (int i = 0; i < argumentSets.Length; i++)
+            {
+                // Reads left pending by a failed or killed command must still be observed
+                ObserveFaults(outputTasks[i]);
+                ObserveFaults(errorTasks[i]);
+                processes[i]?.Dispose();
+            }
+        }
+
+        for (int i = 0; i < argumentSets.Length; i++)
+        {
+            results[i] ??= Run(argumentSets[i]);
+        }
+
+        return results;
+    }
+
+    private static void ObserveFaults(Task? task)
+    {
+        task?.ContinueWith(static t => _ = t.Exception, TaskContinuationOptions.OnlyOnFaulted);
+    }
+
     /// <summary>
     /// Run a pactl command synchronously with retry logic, returning full result.
     /// </summary>
@@ -155,7 +249,7 @@ public static partial class PactlCommandRunner
             {
                 var psi = new ProcessStartInfo
                 {
-                    FileName = "pactl",
+                    FileName = PactlPath,
                     Arguments = arguments,
                     RedirectStandardOutput = true,
                     RedirectStandardError = true,
@@ -170,9 +264,20 @@ public static partial class PactlCommandRunner
                     continue;
                 }
 
-                var output = process.StandardOutput.ReadToEnd();
-                var error = process.StandardError.ReadToEnd();
-                process.WaitForExit(timeoutMs);
+                // Drain both pipes concurrently - reading stdout to EOF while pactl is blocked
+                // writing a full stderr pipe (or vice versa) would hang both processes
+                var outputTask = process.StandardOutput.ReadToEndAsync();
+                var errorTask = process.StandardError.ReadToEndAsync();
+
+                if (!WaitForExitOrKill(process, timeoutMs))
+                {
+                    lastError = $"pactl {arguments} timed out after {timeoutMs}ms";
+                    _logger?.LogDebug("{Error} (attempt {Attempt}/{Max})", lastError, attempt, maxRetries);
+                    continue;
+                }
+
+                var output = outputTask.GetAwaiter().GetResult();
+                var error = errorTask.GetAwaiter().GetResult();
 
                 if (process.ExitCode != 0)
                 {
@@ -237,7 +342,10 @@ public static partial class PactlCommandRunner
     {
         Exception? lastException = null;
         string lastError = string.Empty;
-        var argsForLogging = string.Join(" ", arguments);
+        // Only used in debug logs - skip the join when debug logging is off
+        var argsForLogging = _logger?.IsEnabled(LogLevel.Debug) == true
+            ? string.Join(" ", arguments)
+            : string.Empty;
 
         for (int attempt = 1; attempt <= maxRetries; attempt++)
         {
@@ -245,7 +353,7 @@ public static partial class PactlCommandRunner
             {
                 var psi = new ProcessStartInfo
                 {
-                    FileName = "pactl",
+                    FileName = PactlPath,
                     RedirectStandardOutput = true,
                     RedirectStandardError = true,
                     UseShellExecute = false,
@@ -321,6 +429,29 @@ public static partial class PactlCommandRunner
         return new PactlResult(-1, string.Empty, lastError);
     }
 
+    /// <summary>
+    /// Waits up to <paramref name="timeoutMs"/> for a pactl process to exit, killing it if it
+    /// hasn't, so a hung pactl is reaped instead of left behind.
+    /// </summary>
+    /// <returns>True if the process exited on its own; only then is <see cref="Process.ExitCode"/> valid.</returns>
+    internal static bool WaitForExitOrKill(Process process, int timeoutMs)
+    {
+        if (process.WaitForExit(timeoutMs))
+        {
+            return true;
+        }
+
+        try
+        {
+            process.Kill();
+        }
+        catch (InvalidOperationException)
+        {
+            // Exited just after the timeout
+        }
+        return false;
+    }
+
     /// <summary>
     /// Checks if an error is transient and worth retrying.
     /// </summary>
@@ -15,6 +15,18 @@ public class PulseAudioBackend : IBackend
 
     public string Name => "pulse";
 
+    /// <summary>
+    /// Capabilities reported for every sink. They don't depend on the device, so one shared
+    /// instance is built up front instead of fresh arrays on every player creation.
+    /// </summary>
+    private static readonly DeviceCapabilities DefaultCapabilities = new(
+        SupportedSampleRates: new[] { 44100, 48000, 88200, 96000, 176400, 192000 },
+        SupportedBitDepths: new[] { 16, 24, 32 },
+        MaxChannels: 2,
+        PreferredSampleRate: 192000,
+        PreferredBitDepth: 24
+    );
+
     public PulseAudioBackend(
         ILogger<PulseAudioBackend> logger,
         VolumeCommandRunner volumeRunner)
@@ -49,6 +61,7 @@ public class PulseAudioBackend : IBackend
     public void RefreshDevices()
     {
         PulseAudioDeviceEnumerator.RefreshDevices();
+        PulseAudioCardEnumerator.RefreshCards();
     }
 
     public DeviceCapabilities? GetDeviceCapabilities(string? deviceId)
@@ -57,13 +70,7 @@ public class PulseAudioBackend : IBackend
         // Return default high-res support as PulseAudio handles resampling internally.
         _logger.LogDebug("PulseAudio capability query for sink: {Sink} (returning defaults)", deviceId ?? "default");
 
-        return new DeviceCapabilities(
-            SupportedSampleRates: new[] { 44100, 48000, 88200, 96000, 176400, 192000 },
-            SupportedBitDepths: new[] { 16, 24, 32 },
-            MaxChannels: 2,
-            PreferredSampleRate: 192000,
-            PreferredBitDepth: 24
-        );
+        return DefaultCapabilities;
     }
 
     public IAudioPlayer CreatePlayer(string? deviceId, ILoggerFactory loggerFactory)
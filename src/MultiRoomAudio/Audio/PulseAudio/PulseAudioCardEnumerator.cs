@@ -10,6 +10,14 @@ namespace MultiRoomAudio.Audio.PulseAudio;
 /// </summary>
 public static partial class PulseAudioCardEnumerator
 {
+    // Card/profile lists change only on hotplug or profile switches, but are read by
+    // every card listing and every GetCard lookup
+    private static readonly TimeSpan CardCacheTtl = TimeSpan.FromSeconds(2);
+
+    private static readonly object _cacheLock = new();
+    private static PulseAudioCard[]? _cachedCards;
+    private static long _cachedAtTicks;
+
     private static ILogger? _logger;
 
     /// <summary>
@@ -23,8 +31,47 @@ public static partial class PulseAudioCardEnumerator
 
     /// <summary>
     /// Gets all available sound cards with their profiles.
+    /// Results are cached for <see cref="CardCacheTtl"/>; call <see cref="RefreshCards"/>
+    /// to force a fresh query.
     /// </summary>
     public static IEnumerable<PulseAudioCard> GetCards()
+    {
+        // Serialize enumeration so concurrent callers share one pactl round-trip
+        lock (_cacheLock)
+        {
+            if (_cachedCards != null &&
+                Environment.TickCount64 - _cachedAtTicks < (long)CardCacheTtl.TotalMilliseconds)
+            {
+                return _cachedCards;
+            }
+
+            var cards = EnumerateCards();
+
+            // Don't cache empty results - PulseAudio may still be starting up
+            if (cards.Length > 0)
+            {
+                _cachedCards = cards;
+                _cachedAtTicks = Environment.TickCount64;
+            }
+
+            return cards;
+        }
+    }
+
+    /// <summary>
+    /// Discards the cached card list so the next query goes to pactl for live state.
+    /// </summary>
+    public static void RefreshCards()
+    {
+        lock (_cacheLock)
+        {
+            _cachedCards = null;
+        }
+
+        _logger?.LogDebug("PulseAudio card cache invalidated");
+    }
+
+    private static PulseAudioCard[] EnumerateCards()
     {
         var cards = new List<PulseAudioCard>();
 
@@ -34,7 +81,7 @@ public static partial class PulseAudioCardEnumerator
             if (string.IsNullOrEmpty(cardsOutput))
             {
                 _logger?.LogWarning("pactl list cards returned empty output");
-                return cards;
+                return cards.ToArray();
             }
 
             // Parse cards
@@ -63,7 +110,7 @@ public static partial class PulseAudioCardEnumerator
             _logger?.LogError(ex, "Failed to enumerate PulseAudio cards");
         }
 
-        return cards;
+        return cards.ToArray();
     }
 
     /// <summary>
@@ -90,50 +137,17 @@ public static partial class PulseAudioCardEnumerator
     /// <returns>True if successful, false otherwise.</returns>
     public static bool SetCardProfile(string cardNameOrIndex, string profileName, out string? errorMessage)
     {
-        // Validate inputs to prevent command injection
-        if (!IsValidCardName(cardNameOrIndex))
-        {
-            errorMessage = "Invalid card name format.";
-            return false;
-        }
-
-        if (!IsValidProfileName(profileName))
-        {
-            errorMessage = "Invalid profile name format.";
-            return false;
-        }
-
-        // Verify card exists and profile is available
-        var card = GetCard(cardNameOrIndex);
+        var card = ResolveCardForProfile(cardNameOrIndex, profileName, out errorMessage);
         if (card == null)
-        {
-            errorMessage = $"Card '{cardNameOrIndex}' not found.";
             return false;
-        }
-
-        var profile = card.Profiles.FirstOrDefault(p =>
-            p.Name.Equals(profileName, StringComparison.OrdinalIgnoreCase));
-
-        if (profile == null)
-        {
-            var availableProfiles = string.Join(", ", card.Profiles.Select(p => p.Name));
-            errorMessage = $"Profile '{profileName}' not found on card '{card.Name}'. Available profiles: {availableProfiles}";
-            return false;
-        }
-
-        if (!profile.IsAvailable)
-        {
-            errorMessage = $"Profile '{profileName}' is not available (hardware limitation).";
-            return false;
-        }
 
         // Execute the profile change
         try
         {
             var psi = new ProcessStartInfo
             {
-                FileName = "pactl",
-                RedirectStandardOutput = true,
+                FileName = PactlCommandRunner.PactlPath,
+                // set-card-profile writes nothing to stdout, so only stderr gets a pipe
                 RedirectStandardError = true,
                 UseShellExecute = false,
                 CreateNoWindow = true
@@ -151,8 +165,16 @@ public static partial class PulseAudioCardEnumerator
                 return false;
             }
 
-            var error = process.StandardError.ReadToEnd();
-            process.WaitForExit(5000);
+            // Read stderr in the background; a blocking read would only return once pactl
+            // exits, so a hung pactl would never reach the timeout below
+            var errorTask = process.StandardError.ReadToEndAsync();
+            if (!PactlCommandRunner.WaitForExitOrKill(process, 5000))
+            {
+                errorMessage = "pactl set-card-profile did not exit within 5s.";
+                _logger?.LogWarning("Failed to set card profile: {Error}", errorMessage);
+                return false;
+            }
+            var error = errorTask.GetAwaiter().GetResult();
 
             if (process.ExitCode != 0)
             {
@@ -164,6 +186,10 @@ public static partial class PulseAudioCardEnumerator
             }
 
             _logger?.LogInformation("Set card '{Card}' profile to '{Profile}'", card.Name, profileName);
+
+            // Profile changes add/remove sinks
+            RefreshCards();
+            PulseAudioDeviceEnumerator.RefreshDevices();
             errorMessage = null;
             return true;
         }
@@ -175,6 +201,87 @@ public static partial class PulseAudioCardEnumerator
         }
     }
 
+    /// <summary>
+    /// Sets the active profile for a card without blocking the calling thread on pactl.
+    /// </summary>
+    /// <returns>Whether the change succeeded, and an error message if it did not.</returns>
+    public static async Task<(bool Success, string? ErrorMessage)> SetCardProfileAsync(
+        string cardNameOrIndex,
+        string profileName,
+        CancellationToken cancellationToken = default)
+    {
+        var card = ResolveCardForProfile(cardNameOrIndex, profileName, out var errorMessage);
+        if (card == null)
+            return (false, errorMessage);
+
+        var result = await PactlCommandRunner.RunAsync(
+            ["set-card-profile", card.Name, profileName],
+            cancellationToken);
+
+        if (!result.Success)
+        {
+            errorMessage = string.IsNullOrWhiteSpace(result.Error)
+                ? $"pactl set-card-profile failed with exit code {result.ExitCode}"
+                : result.Error.Trim();
+            _logger?.LogWarning("Failed to set card profile: {Error}", errorMessage);
+            return (false, errorMessage);
+        }
+
+        _logger?.LogInformation("Set card '{Card}' profile to '{Profile}'", card.Name, profileName);
+
+        // Profile changes add/remove sinks
+        RefreshCards();
+        PulseAudioDeviceEnumerator.RefreshDevices();
+        return (true, null);
+    }
+
+    /// <summary>
+    /// Validates the inputs and resolves the card, checking the profile exists and is available.
+    /// </summary>
+    /// <returns>The resolved card, or null with <paramref name="errorMessage"/> set.</returns>
+    private static PulseAudioCard? ResolveCardForProfile(string cardNameOrIndex, string profileName, out string? errorMessage)
+    {
+        // Validate inputs to prevent command injection
+        if (!IsValidCardName(cardNameOrIndex))
+        {
+            errorMessage = "Invalid card name format.";
+            return null;
+        }
+
+        if (!IsValidProfileName(profileName))
+        {
+            errorMessage = "Invalid profile name format.";
+            return null;
+        }
+
+        // Verify card exists and profile is available
+        var card = GetCard(cardNameOrIndex);
+        if (card == null)
+        {
+            errorMessage = $"Card '{cardNameOrIndex}' not found.";
+            return null;
+        }
+
+        var profile = card.Profiles.FirstOrDefault(p =>
+            p.Name.Equals(profileName, StringComparison.OrdinalIgnoreCase));
+
+        if (profile == null)
+        {
+            var availableProfiles = string.Join(", ", card.Profiles.Select(p => p.Name));
+            errorMessage = $"Profile '{profileName}' not found on card '{card.Name}'. Available profiles: {availableProfiles}";
+            return null;
+        }
+
+        if (!profile.IsAvailable)
+        {
+            errorMessage = $"Profile '{profileName}' is not available (hardware limitation).";
+            return null;
+        }
+
+        errorMessage = null;
+        return card;
+    }
+
     private static PulseAudioCard? ParseCardBlock(string block)
     {
         // Extract card index from start of block
@@ -272,47 +379,58 @@ public static partial class PulseAudioCardEnumerator
     /// <returns>List of sink names belonging to the card.</returns>
     public static List<string> GetSinksByCard(int cardIndex)
     {
-        var sinks = new List<string>();
+        var sinks = GetSinksGroupedByCard().GetValueOrDefault(cardIndex) ?? new List<string>();
+        _logger?.LogDebug("Found {Count} sinks for card {Card}", sinks.Count, cardIndex);
+        return sinks;
+    }
+
+    /// <summary>
+    /// Gets the sink names of every card from a single pactl query, keyed by card index.
+    /// Use this instead of calling <see cref="GetSinksByCard"/> once per card.
+    /// </summary>
+    public static Dictionary<int, List<string>> GetSinksGroupedByCard()
+    {
+        var sinksByCard = new Dictionary<int, List<string>>();
 
         try
         {
             var output = RunPactl("list sinks");
             if (string.IsNullOrEmpty(output))
-                return sinks;
+                return sinksByCard;
 
             var sinkBlocks = output.Split(new[] { "Sink #" }, StringSplitOptions.RemoveEmptyEntries);
 
             foreach (var block in sinkBlocks)
             {
-                var nameMatch = Regex.Match(block, @"Name:\s*(.+)$", RegexOptions.Multiline);
+                var nameMatch = CardNameRegex().Match(block);
                 if (!nameMatch.Success)
                     continue;
 
-                var cardMatch = Regex.Match(block, @"alsa\.card\s*=\s*""(\d+)""");
+                var cardMatch = SinkAlsaCardRegex().Match(block);
                 if (!cardMatch.Success)
                 {
-                    cardMatch = Regex.Match(block, @"device\.card\s*=\s*""(\d+)""");
+                    cardMatch = SinkDeviceCardRegex().Match(block);
                 }
 
-                if (!cardMatch.Success)
+                if (!cardMatch.Success || !int.TryParse(cardMatch.Groups[1].Value, out var sinkCard))
                     continue;
 
-                if (int.TryParse(cardMatch.Groups[1].Value, out var sinkCard) && sinkCard == cardIndex)
+                if (!sinksByCard.TryGetValue(sinkCard, out var sinks))
                 {
-                    var sinkName = nameMatch.Groups[1].Value.Trim();
-                    sinks.Add(sinkName);
-                    _logger?.LogDebug("Found sink '{Sink}' belonging to card {Card}", sinkName, cardIndex);
+                    sinks = new List<string>();
+                    sinksByCard[sinkCard] = sinks;
                 }
+                sinks.Add(nameMatch.Groups[1].Value.Trim());
             }
 
-            _logger?.LogDebug("Found {Count} sinks for card {Card}", sinks.Count, cardIndex);
+            _logger?.LogDebug("Found sinks for {Count} cards", sinksByCard.Count);
         }
         catch (Exception ex)
         {
-            _logger?.LogError(ex, "Failed to enumerate sinks for card {Card}", cardIndex);
+            _logger?.LogError(ex, "Failed to enumerate sinks by card");
         }
 
-        return sinks;
+        return sinksByCard;
     }
 
     /// <summary>
@@ -360,6 +478,13 @@ public static partial class PulseAudioCardEnumerator
     [GeneratedRegex(@"Name:\s*(.+)$", RegexOptions.Multiline)]
     private static partial Regex CardNameRegex();
 
+    // Card index a sink belongs to, from its ALSA property or the generic device one
+    [GeneratedRegex(@"alsa\.card\s*=\s*""(\d+)""")]
+    private static partial Regex SinkAlsaCardRegex();
+
+    [GeneratedRegex(@"device\.card\s*=\s*""(\d+)""")]
+    private static partial Regex SinkDeviceCardRegex();
+
     [GeneratedRegex(@"Driver:\s*(.+)$", RegexOptions.Multiline)]
     private static partial Regex DriverRegex();
 
@@ -9,6 +9,16 @@ namespace MultiRoomAudio.Audio.PulseAudio;
 /// </summary>
 public static partial class PulseAudioDeviceEnumerator
 {
+    /// <summary>
+    /// How long an enumeration result is reused before pactl is queried again.
+    /// Keeps bursts of callers (device list, matching, card views) to one pactl round-trip.
+    /// </summary>
+    private static readonly TimeSpan DeviceCacheTtl = TimeSpan.FromSeconds(2);
+
+    private static readonly object _cacheLock = new();
+    private static AudioDevice[]? _cachedDevices;
+    private static long _cachedAtTicks;
+
     private static ILogger? _logger;
 
     /// <summary>
@@ -22,22 +32,51 @@ public static partial class PulseAudioDeviceEnumerator
 
     /// <summary>
     /// Gets all available audio output sinks from PulseAudio.
+    /// Results are cached for <see cref="DeviceCacheTtl"/>; call <see cref="RefreshDevices"/>
+    /// after changing sinks or card profiles to force a fresh query.
     /// </summary>
     public static IEnumerable<AudioDevice> GetOutputDevices()
+    {
+        // Serialize enumeration so concurrent callers share one pactl round-trip
+        lock (_cacheLock)
+        {
+            if (_cachedDevices != null &&
+                Environment.TickCount64 - _cachedAtTicks < (long)DeviceCacheTtl.TotalMilliseconds)
+            {
+                return _cachedDevices;
+            }
+
+            var devices = EnumerateOutputDevices();
+
+            // Don't cache empty results - PulseAudio may still be starting up
+            if (devices.Length > 0)
+            {
+                _cachedDevices = devices;
+                _cachedAtTicks = Environment.TickCount64;
+            }
+
+            return devices;
+        }
+    }
+
+    /// <summary>
+    /// Queries pactl for the current sinks.
+    /// </summary>
+    private static AudioDevice[] EnumerateOutputDevices()
     {
         var devices = new List<AudioDevice>();
 
         try
         {
-            // Get default sink name first
-            var defaultSink = GetDefaultSinkName();
-
-            // Get all sinks
-            var sinksOutput = RunPactl("list sinks");
+            // The two pactl queries are independent, so run them side by side
+            // instead of paying for them back to back
+            var outputs = PactlCommandRunner.RunConcurrently("list sinks", "info");
+            var sinksOutput = outputs[0];
+            var defaultSink = ParseDefaultSinkName(outputs[1]);
             if (string.IsNullOrEmpty(sinksOutput))
             {
                 _logger?.LogWarning("pactl list sinks returned empty output");
-                return devices;
+                return devices.ToArray();
             }
 
             // Parse sinks
@@ -66,7 +105,7 @@ public static partial class PulseAudioDeviceEnumerator
             _logger?.LogError(ex, "Failed to enumerate PulseAudio sinks");
         }
 
-        return devices;
+        return devices.ToArray();
     }
 
     /// <summary>
@@ -119,19 +158,23 @@ public static partial class PulseAudioDeviceEnumerator
     }
 
     /// <summary>
-    /// Refreshes device list. For PulseAudio, this is a no-op since pactl always queries live state.
+    /// Refreshes device list by discarding the cached enumeration.
+    /// The next query goes to pactl for live state.
     /// </summary>
     public static void RefreshDevices()
     {
-        // No-op: pactl always queries current PulseAudio state
-        _logger?.LogDebug("PulseAudio device refresh requested (no-op, pactl queries live state)");
+        lock (_cacheLock)
+        {
+            _cachedDevices = null;
+        }
+
+        _logger?.LogDebug("PulseAudio device cache invalidated");
     }
 
-    private static string? GetDefaultSinkName()
+    private static string? ParseDefaultSinkName(string? output)
     {
         try
         {
-            var output = RunPactl("info");
             if (string.IsNullOrEmpty(output))
                 return null;
 
@@ -144,7 +187,7 @@ public static partial class PulseAudioDeviceEnumerator
         }
         catch (Exception ex)
         {
-            _logger?.LogDebug(ex, "Failed to get default sink name");
+            _logger?.LogDebug(ex, "Failed to parse default sink name");
         }
 
         return null;
@@ -153,12 +196,9 @@ public static partial class PulseAudioDeviceEnumerator
     private static AudioDevice? ParseSinkBlock(string block, string? defaultSink)
     {
         // Extract sink index from start of block
-        var indexMatch = SinkIndexRegex().Match(block);
-        if (!indexMatch.Success)
+        if (!TryParseSinkIndex(block, out var index))
             return null;
 
-        var index = int.Parse(indexMatch.Groups[1].Value);
-
         // Extract sink name
         var nameMatch = SinkNameRegex().Match(block);
         if (!nameMatch.Success)
@@ -183,11 +223,11 @@ public static partial class PulseAudioDeviceEnumerator
             var specParts = sampleSpecMatch.Groups[1].Value.Split(' ', StringSplitOptions.RemoveEmptyEntries);
             foreach (var part in specParts)
             {
-                if (part.EndsWith("ch") && int.TryParse(part[..^2], out var ch))
+                if (part.EndsWith("ch") && int.TryParse(part.AsSpan(0, part.Length - 2), out var ch))
                 {
                     channels = ch;
                 }
-                else if (part.EndsWith("Hz") && int.TryParse(part[..^2], out var rate))
+                else if (part.EndsWith("Hz") && int.TryParse(part.AsSpan(0, part.Length - 2), out var rate))
                 {
                     sampleRate = rate;
                 }
@@ -224,6 +264,27 @@ public static partial class PulseAudioDeviceEnumerator
         );
     }
 
+    /// <summary>
+    /// Parses the sink index at the start of a block (the digits that followed "Sink #").
+    /// Well-formed blocks are handled with a span scan; the regex is only a fallback.
+    /// </summary>
+    private static bool TryParseSinkIndex(string block, out int index)
+    {
+        var digits = 0;
+        while (digits < block.Length && char.IsAsciiDigit(block[digits]))
+            digits++;
+
+        if (digits > 0 && int.TryParse(block.AsSpan(0, digits), out index))
+            return true;
+
+        var indexMatch = SinkIndexRegex().Match(block);
+        if (indexMatch.Success && int.TryParse(indexMatch.Groups[1].ValueSpan, out index))
+            return true;
+
+        index = 0;
+        return false;
+    }
+
     /// <summary>
     /// Extracts stable device identifiers from the Properties section of a pactl sink block.
     /// These identifiers persist across reboots and can be used to re-match devices.
@@ -29,14 +29,15 @@ public static class CardsEndpoint
     /// <param name="app">The WebApplication to register endpoints on.</param>
     public static void MapCardsEndpoints(this WebApplication app)
     {
+        var logger = app.Services.GetRequiredService<ILoggerFactory>().CreateLogger("CardsEndpoint");
+
         var group = app.MapGroup("/api/cards")
             .WithTags("Cards")
             .WithOpenApi();
 
         // GET /api/cards - List all sound cards with their profiles
-        group.MapGet("/", (CardProfileService service, ILoggerFactory loggerFactory) =>
+        group.MapGet("/", (CardProfileService service) =>
         {
-            var logger = loggerFactory.CreateLogger("CardsEndpoint");
             logger.LogDebug("API: GET /api/cards");
             return ApiExceptionHandler.Execute(() =>
             {
@@ -49,9 +50,8 @@ public static class CardsEndpoint
         .WithDescription("List all PulseAudio sound cards with their available profiles");
 
         // GET /api/cards/saved - Get saved profile configurations
-        group.MapGet("/saved", (CardProfileService service, ILoggerFactory loggerFactory) =>
+        group.MapGet("/saved", (CardProfileService service) =>
         {
-            var logger = loggerFactory.CreateLogger("CardsEndpoint");
             logger.LogDebug("API: GET /api/cards/saved");
 
             var saved = service.GetSavedProfiles();
@@ -65,9 +65,8 @@ public static class CardsEndpoint
         .WithDescription("Get all saved card profile configurations that will be restored on startup");
 
         // GET /api/cards/{nameOrIndex} - Get specific card
-        group.MapGet("/{nameOrIndex}", (string nameOrIndex, CardProfileService service, ILoggerFactory loggerFactory) =>
+        group.MapGet("/{nameOrIndex}", (string nameOrIndex, CardProfileService service) =>
         {
-            var logger = loggerFactory.CreateLogger("CardsEndpoint");
             logger.LogDebug("API: GET /api/cards/{CardId}", nameOrIndex);
             return ApiExceptionHandler.Execute(() =>
             {
@@ -87,10 +86,8 @@ public static class CardsEndpoint
         group.MapPut("/{nameOrIndex}/profile", async (
             string nameOrIndex,
             SetCardProfileRequest request,
-            CardProfileService service,
-            ILoggerFactory loggerFactory) =>
+            CardProfileService service) =>
         {
-            var logger = loggerFactory.CreateLogger("CardsEndpoint");
             logger.LogDebug("API: PUT /api/cards/{CardId}/profile - Setting to {Profile}",
                 nameOrIndex, request.Profile);
 
@@ -137,10 +134,8 @@ public static class CardsEndpoint
         group.MapPut("/{nameOrIndex}/boot-mute", (
             string nameOrIndex,
             SetCardBootMuteRequest request,
-            CardProfileService service,
-            ILoggerFactory loggerFactory) =>
+            CardProfileService service) =>
         {
-            var logger = loggerFactory.CreateLogger("CardsEndpoint");
             logger.LogDebug("API: PUT /api/cards/{CardId}/boot-mute to {Muted}", nameOrIndex, request.Muted);
 
             var result = service.SetCardBootMute(nameOrIndex, request.Muted);
@@ -166,10 +161,8 @@ public static class CardsEndpoint
         group.MapPut("/{nameOrIndex}/mute", async (
             string nameOrIndex,
             SetCardMuteRequest request,
-            CardProfileService service,
-            ILoggerFactory loggerFactory) =>
+            CardProfileService service) =>
         {
-            var logger = loggerFactory.CreateLogger("CardsEndpoint");
             logger.LogDebug("API: PUT /api/cards/{CardId}/mute to {Muted}", nameOrIndex, request.Muted);
 
             var result = await service.SetCardMuteAsync(nameOrIndex, request.Muted);
@@ -195,10 +188,8 @@ public static class CardsEndpoint
         group.MapPut("/{nameOrIndex}/max-volume", async (
             string nameOrIndex,
             SetCardMaxVolumeRequest request,
-            CardProfileService service,
-            ILoggerFactory loggerFactory) =>
+            CardProfileService service) =>
         {
-            var logger = loggerFactory.CreateLogger("CardsEndpoint");
             logger.LogDebug("API: PUT /api/cards/{CardId}/max-volume to {MaxVolume}", nameOrIndex, request.MaxVolume);
 
             var result = await service.SetCardMaxVolumeAsync(nameOrIndex, request.MaxVolume);
@@ -223,10 +214,8 @@ public static class CardsEndpoint
         // DELETE /api/cards/{nameOrIndex}/saved - Remove saved profile for a card
         group.MapDelete("/{nameOrIndex}/saved", (
             string nameOrIndex,
-            CardProfileService service,
-            ILoggerFactory loggerFactory) =>
+            CardProfileService service) =>
         {
-            var logger = loggerFactory.CreateLogger("CardsEndpoint");
             logger.LogDebug("API: DELETE /api/cards/{CardId}/saved", nameOrIndex);
 
             var removed = service.RemoveSavedProfile(nameOrIndex);
@@ -33,6 +33,8 @@ public static class DevicesEndpoint
     /// <param name="app">The WebApplication to register endpoints on.</param>
     public static void MapDevicesEndpoints(this WebApplication app)
     {
+        var logger = app.Services.GetRequiredService<ILoggerFactory>().CreateLogger("DevicesEndpoint");
+
         var group = app.MapGroup("/api/devices")
             .WithTags("Devices")
             .WithOpenApi();
@@ -40,16 +42,15 @@ public static class DevicesEndpoint
         // GET /api/devices - List all output devices (enriched with aliases)
         group.MapGet("/", (
             BackendFactory backendFactory,
-            DeviceMatchingService matchingService,
-            ILoggerFactory loggerFactory) =>
+            DeviceMatchingService matchingService) =>
         {
-            var logger = loggerFactory.CreateLogger("DevicesEndpoint");
             logger.LogDebug("API: GET /api/devices - Enumerating audio devices via {Backend} backend",
                 backendFactory.BackendName);
             return ApiExceptionHandler.Execute(() =>
             {
                 // Get devices enriched with aliases
                 var devices = matchingService.GetEnrichedDevices().ToList();
+                var defaultDevice = devices.FirstOrDefault(d => d.IsDefault);
                 logger.LogInformation("Audio device enumeration found {DeviceCount} output devices", devices.Count);
 
                 if (devices.Count == 0)
@@ -58,7 +59,6 @@ public static class DevicesEndpoint
                 }
                 else
                 {
-                    var defaultDevice = devices.FirstOrDefault(d => d.IsDefault);
                     logger.LogDebug("Default audio device: {DefaultDevice}",
                         defaultDevice?.Name ?? "(none)");
                 }
@@ -67,7 +67,7 @@ public static class DevicesEndpoint
                 {
                     devices,
                     count = devices.Count,
-                    defaultDevice = devices.FirstOrDefault(d => d.IsDefault)?.Id,
+                    defaultDevice = defaultDevice?.Id,
                     backend = backendFactory.BackendName
                 });
             }, logger, "enumerate devices");
@@ -77,9 +77,8 @@ public static class DevicesEndpoint
 
         // GET /api/devices/default - Get default device
         // NOTE: This route must be registered BEFORE /{id} to prevent the parameterized route from intercepting it
-        group.MapGet("/default", (BackendFactory backendFactory, ILoggerFactory loggerFactory) =>
+        group.MapGet("/default", (BackendFactory backendFactory) =>
         {
-            var logger = loggerFactory.CreateLogger("DevicesEndpoint");
             logger.LogDebug("API: GET /api/devices/default");
             return ApiExceptionHandler.Execute(() =>
             {
@@ -99,9 +98,8 @@ public static class DevicesEndpoint
         .WithDescription("Get the default audio output device");
 
         // GET /api/devices/{id} - Get specific device
-        group.MapGet("/{id}", (string id, DeviceMatchingService matchingService, ILoggerFactory loggerFactory) =>
+        group.MapGet("/{id}", (string id, DeviceMatchingService matchingService) =>
         {
-            var logger = loggerFactory.CreateLogger("DevicesEndpoint");
             logger.LogDebug("API: GET /api/devices/{DeviceId}", id);
             return ApiExceptionHandler.Execute(() =>
             {
@@ -118,9 +116,8 @@ public static class DevicesEndpoint
         .WithDescription("Get details of a specific audio device");
 
         // GET /api/devices/{id}/capabilities - Get device audio capabilities
-        group.MapGet("/{id}/capabilities", (string id, BackendFactory backendFactory, ILoggerFactory loggerFactory) =>
+        group.MapGet("/{id}/capabilities", (string id, BackendFactory backendFactory) =>
         {
-            var logger = loggerFactory.CreateLogger("DevicesEndpoint");
             logger.LogDebug("API: GET /api/devices/{DeviceId}/capabilities", id);
             return ApiExceptionHandler.Execute(() =>
             {
@@ -153,10 +150,8 @@ public static class DevicesEndpoint
         // POST /api/devices/refresh - Refresh device list
         group.MapPost("/refresh", (
             BackendFactory backendFactory,
-            DeviceMatchingService matchingService,
-            ILoggerFactory loggerFactory) =>
+            DeviceMatchingService matchingService) =>
         {
-            var logger = loggerFactory.CreateLogger("DevicesEndpoint");
             logger.LogDebug("API: POST /api/devices/refresh");
             return ApiExceptionHandler.Execute(() =>
             {
@@ -188,9 +183,8 @@ public static class DevicesEndpoint
         .WithDescription("Re-enumerate audio devices (detect newly connected USB devices)");
 
         // GET /api/devices/aliases - Get all device aliases
-        group.MapGet("/aliases", (ConfigurationService config, ILoggerFactory loggerFactory) =>
+        group.MapGet("/aliases", (ConfigurationService config) =>
         {
-            var logger = loggerFactory.CreateLogger("DevicesEndpoint");
             logger.LogDebug("API: GET /api/devices/aliases");
 
             var aliases = config.GetAllDeviceAliases();
@@ -205,10 +199,8 @@ public static class DevicesEndpoint
 
         // POST /api/devices/rematch - Force device re-matching
         group.MapPost("/rematch", (
-            DeviceMatchingService matchingService,
-            ILoggerFactory loggerFactory) =>
+            DeviceMatchingService matchingService) =>
         {
-            var logger = loggerFactory.CreateLogger("DevicesEndpoint");
             logger.LogDebug("API: POST /api/devices/rematch");
             return ApiExceptionHandler.Execute(() =>
             {
@@ -234,10 +226,8 @@ public static class DevicesEndpoint
             string id,
             DeviceAliasRequest request,
             BackendFactory backendFactory,
-            ConfigurationService config,
-            ILoggerFactory loggerFactory) =>
+            ConfigurationService config) =>
         {
-            var logger = loggerFactory.CreateLogger("DevicesEndpoint");
             logger.LogDebug("API: PUT /api/devices/{DeviceId}/alias", id);
             return ApiExceptionHandler.Execute(() =>
             {
@@ -272,10 +262,8 @@ public static class DevicesEndpoint
             string id,
             DeviceHiddenRequest request,
             BackendFactory backendFactory,
-            ConfigurationService config,
-            ILoggerFactory loggerFactory) =>
+            ConfigurationService config) =>
         {
-            var logger = loggerFactory.CreateLogger("DevicesEndpoint");
             logger.LogDebug("API: PUT /api/devices/{DeviceId}/hidden", id);
             return ApiExceptionHandler.Execute(() =>
             {
@@ -311,10 +299,8 @@ public static class DevicesEndpoint
             DeviceMaxVolumeRequest request,
             BackendFactory backendFactory,
             ConfigurationService config,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("DevicesEndpoint");
             logger.LogDebug("API: PUT /api/devices/{DeviceId}/max-volume", id);
             return await ApiExceptionHandler.ExecuteAsync(async () =>
             {
@@ -9,6 +9,12 @@ namespace MultiRoomAudio.Controllers;
 /// </summary>
 public static class HealthEndpoint
 {
+    // Both are fixed for the lifetime of the process, so resolve them once rather than
+    // reading the environment / querying the process on every health poll.
+    private static readonly string Version = ResolveVersion();
+    private static readonly DateTime ProcessStartUtc =
+        System.Diagnostics.Process.GetCurrentProcess().StartTime.ToUniversalTime();
+
     /// <summary>
     /// Registers health check and service status API endpoints with the application.
     /// </summary>
@@ -30,7 +36,7 @@ public static class HealthEndpoint
             return Results.Ok(new HealthResponse(
                 Status: "healthy",
                 Timestamp: DateTime.UtcNow,
-                Version: GetVersion()
+                Version: Version
             ));
         })
         .WithTags("Health")
@@ -99,7 +105,7 @@ public static class HealthEndpoint
                 return Results.Ok(new
                 {
                     service = "sendspin-service",
-                    version = GetVersion(),
+                    version = Version,
                     uptime = GetUptime(),
                     timestamp = DateTime.UtcNow,
                     players = new
@@ -130,7 +136,7 @@ public static class HealthEndpoint
         .WithOpenApi();
     }
 
-    private static string GetVersion()
+    private static string ResolveVersion()
     {
         // First check environment variable set by Docker build args
         var envVersion = Environment.GetEnvironmentVariable("APP_VERSION");
@@ -147,7 +153,7 @@ public static class HealthEndpoint
 
     private static string GetUptime()
     {
-        var uptime = DateTime.UtcNow - System.Diagnostics.Process.GetCurrentProcess().StartTime.ToUniversalTime();
+        var uptime = DateTime.UtcNow - ProcessStartUtc;
         return uptime.ToString(@"d\.hh\:mm\:ss");
     }
 }
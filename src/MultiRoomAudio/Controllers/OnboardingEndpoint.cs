@@ -28,6 +28,8 @@ public static class OnboardingEndpoint
     /// <param name="app">The WebApplication to register endpoints on.</param>
     public static void MapOnboardingEndpoints(this WebApplication app)
     {
+        var logger = app.Services.GetRequiredService<ILoggerFactory>().CreateLogger("OnboardingEndpoint");
+
         var group = app.MapGroup("/api/onboarding")
             .WithTags("Onboarding")
             .WithOpenApi();
@@ -43,10 +45,8 @@ public static class OnboardingEndpoint
         // POST /api/onboarding/complete - Mark onboarding as completed
         group.MapPost("/complete", (
             OnboardingCompleteRequest? request,
-            OnboardingService onboarding,
-            ILoggerFactory loggerFactory) =>
+            OnboardingService onboarding) =>
         {
-            var logger = loggerFactory.CreateLogger("OnboardingEndpoint");
             logger.LogDebug("API: POST /api/onboarding/complete");
 
             onboarding.MarkCompleted(
@@ -64,9 +64,8 @@ public static class OnboardingEndpoint
         .WithDescription("Mark onboarding wizard as completed");
 
         // POST /api/onboarding/skip - Skip onboarding
-        group.MapPost("/skip", (OnboardingService onboarding, ILoggerFactory loggerFactory) =>
+        group.MapPost("/skip", (OnboardingService onboarding) =>
         {
-            var logger = loggerFactory.CreateLogger("OnboardingEndpoint");
             logger.LogDebug("API: POST /api/onboarding/skip");
 
             onboarding.Skip();
@@ -82,9 +81,8 @@ public static class OnboardingEndpoint
         .WithDescription("Skip the onboarding wizard");
 
         // POST /api/onboarding/reset - Reset onboarding to allow re-running
-        group.MapPost("/reset", (OnboardingService onboarding, ILoggerFactory loggerFactory) =>
+        group.MapPost("/reset", (OnboardingService onboarding) =>
         {
-            var logger = loggerFactory.CreateLogger("OnboardingEndpoint");
             logger.LogDebug("API: POST /api/onboarding/reset");
 
             onboarding.Reset();
@@ -106,10 +104,8 @@ public static class OnboardingEndpoint
             TestToneRequest? request,
             BackendFactory backendFactory,
             ToneGeneratorService toneGenerator,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("OnboardingEndpoint");
             logger.LogDebug("API: POST /api/devices/{DeviceId}/test-tone", id);
             return await ApiExceptionHandler.ExecuteAsync(async () =>
             {
@@ -183,10 +179,8 @@ public static class OnboardingEndpoint
         app.MapPost("/api/onboarding/create-players", async (
             BatchCreatePlayersRequest request,
             PlayerManagerService playerManager,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("OnboardingEndpoint");
             logger.LogDebug("API: POST /api/onboarding/create-players with {Count} players", request.Players?.Count ?? 0);
 
             if (request.Players == null || request.Players.Count == 0)
@@ -51,14 +51,15 @@ public static class PlayersEndpoint
     /// <param name="app">The WebApplication to register endpoints on.</param>
     public static void MapPlayersEndpoints(this WebApplication app)
     {
+        var logger = app.Services.GetRequiredService<ILoggerFactory>().CreateLogger("PlayersEndpoint");
+
         var group = app.MapGroup("/api/players")
             .WithTags("Players")
             .WithOpenApi();
 
         // GET /api/players - List all players
-        group.MapGet("/", (PlayerManagerService manager, ILoggerFactory loggerFactory) =>
+        group.MapGet("/", (PlayerManagerService manager) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: GET /api/players");
             var response = manager.GetAllPlayers();
             logger.LogDebug("API: Returning {PlayerCount} players", response.Count);
@@ -68,9 +69,8 @@ public static class PlayersEndpoint
         .WithDescription("Get all active players");
 
         // GET /api/players/{name} - Get specific player
-        group.MapGet("/{name}", (string name, PlayerManagerService manager, ILoggerFactory loggerFactory) =>
+        group.MapGet("/{name}", (string name, PlayerManagerService manager) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: GET /api/players/{PlayerName}", name);
             var player = manager.GetPlayer(name);
             if (player == null)
@@ -82,9 +82,8 @@ public static class PlayersEndpoint
         .WithDescription("Get details of a specific player");
 
         // GET /api/players/{name}/stats - Get real-time player stats (Stats for Nerds)
-        group.MapGet("/{name}/stats", (string name, PlayerManagerService manager, ILoggerFactory loggerFactory) =>
+        group.MapGet("/{name}/stats", (string name, PlayerManagerService manager) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: GET /api/players/{PlayerName}/stats", name);
             var stats = manager.GetPlayerStats(name);
             if (stats == null)
@@ -99,10 +98,8 @@ public static class PlayersEndpoint
         group.MapPost("/", async (
             PlayerCreateRequest request,
             PlayerManagerService manager,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: POST /api/players - Creating player {PlayerName}", request.Name);
             return await ApiExceptionHandler.ExecuteAsync(async () =>
             {
@@ -117,10 +114,8 @@ public static class PlayersEndpoint
         // DELETE /api/players/{name} - Stop and remove player (and config)
         group.MapDelete("/{name}", async (
             string name,
-            PlayerManagerService manager,
-            ILoggerFactory loggerFactory) =>
+            PlayerManagerService manager) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: DELETE /api/players/{PlayerName}", name);
             var deleted = await manager.DeletePlayerAsync(name);
             if (!deleted)
@@ -135,10 +130,8 @@ public static class PlayersEndpoint
         // POST /api/players/{name}/stop - Stop player (keeps config)
         group.MapPost("/{name}/stop", async (
             string name,
-            PlayerManagerService manager,
-            ILoggerFactory loggerFactory) =>
+            PlayerManagerService manager) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: POST /api/players/{PlayerName}/stop", name);
             var stopped = await manager.StopPlayerAsync(name);
             if (!stopped)
@@ -154,10 +147,8 @@ public static class PlayersEndpoint
         group.MapPost("/{name}/start", async (
             string name,
             PlayerManagerService manager,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: POST /api/players/{PlayerName}/start", name);
             return await ApiExceptionHandler.ExecuteAsync(async () =>
             {
@@ -176,10 +167,8 @@ public static class PlayersEndpoint
         group.MapPost("/{name}/restart", async (
             string name,
             PlayerManagerService manager,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: POST /api/players/{PlayerName}/restart", name);
             return await ApiExceptionHandler.ExecuteAsync(async () =>
             {
@@ -199,10 +188,8 @@ public static class PlayersEndpoint
             string name,
             DeviceSwitchRequest request,
             PlayerManagerService manager,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: PUT /api/players/{PlayerName}/device to {Device}",
                 name, request.Device ?? "(default)");
             return await ApiExceptionHandler.ExecuteAsync(async () =>
@@ -224,10 +211,8 @@ public static class PlayersEndpoint
             string name,
             VolumeRequest request,
             PlayerManagerService manager,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogInformation("VOLUME [API] PUT /api/players/{Name}/volume: {Volume}%", name, request.Volume);
             return await ApiExceptionHandler.ExecuteAsync(async () =>
             {
@@ -245,19 +230,17 @@ public static class PlayersEndpoint
         group.MapPut("/{name}/startup-volume", (
             string name,
             VolumeRequest request,
-            ConfigurationService config,
-            ILoggerFactory loggerFactory) =>
+            ConfigurationService config) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogInformation("VOLUME [API] PUT /api/players/{Name}/startup-volume: {Volume}%", name, request.Volume);
             return ApiExceptionHandler.Execute(() =>
             {
-                // Update persisted config only
-                if (!config.Players.TryGetValue(name, out var playerConfig))
+                // Update persisted config only (debounced - the UI sends this while the slider moves)
+                var volume = Math.Clamp(request.Volume, 0, 100);
+                if (!config.UpdatePlayerField(name, c => c.Volume = volume, save: false))
                     return PlayerNotFoundResult(name, logger, "set startup volume");
 
-                playerConfig.Volume = Math.Clamp(request.Volume, 0, 100);
-                config.Save();
+                config.RequestSave();
 
                 logger.LogInformation("VOLUME [StartupConfig] Player '{Name}': startup volume set to {Volume}%",
                     name, request.Volume);
@@ -273,10 +256,8 @@ public static class PlayersEndpoint
         group.MapPut("/{name}/mute", (
             string name,
             MuteRequest request,
-            PlayerManagerService manager,
-            ILoggerFactory loggerFactory) =>
+            PlayerManagerService manager) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: PUT /api/players/{PlayerName}/mute to {Muted}", name, request.Muted);
             var success = manager.SetMuted(name, request.Muted);
             if (!success)
@@ -292,18 +273,17 @@ public static class PlayersEndpoint
             string name,
             OffsetRequest request,
             PlayerManagerService manager,
-            ConfigurationService config,
-            ILoggerFactory loggerFactory) =>
+            ConfigurationService config) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: PUT /api/players/{PlayerName}/offset to {DelayMs}ms", name, request.DelayMs);
 
             // Apply to running player (affects clock sync timing immediately)
             if (!manager.SetDelayOffset(name, request.DelayMs))
                 return PlayerNotFoundResult(name, logger, "offset change");
 
-            // Also persist to config so it survives restarts
-            config.UpdatePlayerField(name, c => c.DelayMs = request.DelayMs);
+            // Also persist to config so it survives restarts (debounced for rapid +/- adjustments)
+            if (config.UpdatePlayerField(name, c => c.DelayMs = request.DelayMs, save: false))
+                config.RequestSave();
 
             return Results.Ok(new SuccessResponse(true, $"Offset set to {request.DelayMs}ms"));
         })
@@ -313,10 +293,8 @@ public static class PlayersEndpoint
         // POST /api/players/{name}/pause - Pause playback
         group.MapPost("/{name}/pause", (
             string name,
-            PlayerManagerService manager,
-            ILoggerFactory loggerFactory) =>
+            PlayerManagerService manager) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: POST /api/players/{PlayerName}/pause", name);
             return ApiExceptionHandler.Execute(() =>
             {
@@ -334,10 +312,8 @@ public static class PlayersEndpoint
         // POST /api/players/{name}/resume - Resume playback
         group.MapPost("/{name}/resume", (
             string name,
-            PlayerManagerService manager,
-            ILoggerFactory loggerFactory) =>
+            PlayerManagerService manager) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: POST /api/players/{PlayerName}/resume", name);
             return ApiExceptionHandler.Execute(() =>
             {
@@ -358,10 +334,8 @@ public static class PlayersEndpoint
             PlayerUpdateRequest request,
             PlayerManagerService manager,
             ConfigurationService config,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: PUT /api/players/{PlayerName}", name);
             return await ApiExceptionHandler.ExecuteAsync(async () =>
             {
@@ -414,16 +388,25 @@ public static class PlayersEndpoint
                 }
 
                 // Update config for changes that require restart
-                var savedConfig = config.GetPlayer(currentName);
-                if (savedConfig != null)
+                // Mutate the stored entry in place and only rewrite the file if something changed
+                if (request.ServerUrl != null)
                 {
-                    if (request.ServerUrl != null && request.ServerUrl != (savedConfig.Server ?? ""))
+                    var newServer = request.ServerUrl == "" ? null : request.ServerUrl;
+                    var serverChanged = false;
+                    config.UpdatePlayerField(currentName, c =>
+                    {
+                        if (c.Server == newServer)
+                            return;
+
+                        c.Server = newServer;
+                        serverChanged = true;
+                    }, save: false);
+
+                    if (serverChanged)
                     {
-                        savedConfig.Server = request.ServerUrl == "" ? null : request.ServerUrl;
                         needsRestart = true;
+                        config.Save();
                     }
-
-                    config.Save();
                 }
 
                 // Return response indicating if restart is needed
@@ -445,10 +428,8 @@ public static class PlayersEndpoint
         group.MapPut("/{name}/rename", (
             string name,
             RenameRequest request,
-            PlayerManagerService manager,
-            ILoggerFactory loggerFactory) =>
+            PlayerManagerService manager) =>
         {
-            var logger = loggerFactory.CreateLogger("PlayersEndpoint");
             logger.LogDebug("API: PUT /api/players/{PlayerName}/rename to {NewName}", name, request.NewName);
             return ApiExceptionHandler.Execute(() =>
             {
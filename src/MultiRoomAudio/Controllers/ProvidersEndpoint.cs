@@ -7,6 +7,18 @@ namespace MultiRoomAudio.Controllers;
 /// </summary>
 public static class ProvidersEndpoint
 {
+    // Sendspin-only implementation; the list is fixed for a given build
+    private static readonly ProviderInfo[] Providers =
+    {
+        new ProviderInfo
+        {
+            Type = "sendspin",
+            DisplayName = "Sendspin",
+            Available = true,
+            Description = "Native SendSpin.SDK audio streaming"
+        }
+    };
+
     /// <summary>
     /// Registers provider information API endpoints with the application.
     /// </summary>
@@ -24,21 +36,11 @@ public static class ProvidersEndpoint
             .WithOpenApi();
 
         // GET /api/providers - List available providers
-        group.MapGet("/", () =>
+        group.MapGet("/", (HttpContext context) =>
         {
-            // Sendspin-only implementation
-            var providers = new[]
-            {
-                new ProviderInfo
-                {
-                    Type = "sendspin",
-                    DisplayName = "Sendspin",
-                    Available = true,
-                    Description = "Native SendSpin.SDK audio streaming"
-                }
-            };
-
-            return Results.Ok(providers);
+            // Static per build, so let browsers reuse it for a day
+            context.Response.Headers.CacheControl = "public, max-age=86400";
+            return Results.Ok(Providers);
         })
         .WithName("ListProviders")
         .WithDescription("Get available audio player providers");
@@ -45,14 +45,15 @@ public static class SinksEndpoint
     /// <param name="app">The WebApplication to register endpoints on.</param>
     public static void MapSinksEndpoints(this WebApplication app)
     {
+        var logger = app.Services.GetRequiredService<ILoggerFactory>().CreateLogger("SinksEndpoint");
+
         var group = app.MapGroup("/api/sinks")
             .WithTags("Custom Sinks")
             .WithOpenApi();
 
         // GET /api/sinks - List all custom sinks
-        group.MapGet("/", (CustomSinksService service, ILoggerFactory loggerFactory) =>
+        group.MapGet("/", (CustomSinksService service) =>
         {
-            var logger = loggerFactory.CreateLogger("SinksEndpoint");
             logger.LogDebug("API: GET /api/sinks");
             var response = service.GetAllSinks();
             logger.LogDebug("API: Returning {SinkCount} custom sinks", response.Count);
@@ -77,9 +78,8 @@ public static class SinksEndpoint
         .WithDescription("Get available PulseAudio channel names for remap-sink configuration");
 
         // GET /api/sinks/{name} - Get specific sink
-        group.MapGet("/{name}", (string name, CustomSinksService service, ILoggerFactory loggerFactory) =>
+        group.MapGet("/{name}", (string name, CustomSinksService service) =>
         {
-            var logger = loggerFactory.CreateLogger("SinksEndpoint");
             logger.LogDebug("API: GET /api/sinks/{SinkName}", name);
             var sink = service.GetSink(name);
             if (sink == null)
@@ -94,10 +94,8 @@ public static class SinksEndpoint
         group.MapPost("/combine", async (
             CombineSinkCreateRequest request,
             CustomSinksService service,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("SinksEndpoint");
             logger.LogDebug("API: POST /api/sinks/combine - Creating {SinkName}", request.Name);
             return await ApiExceptionHandler.ExecuteAsync(async () =>
             {
@@ -113,10 +111,8 @@ public static class SinksEndpoint
         group.MapPost("/remap", async (
             RemapSinkCreateRequest request,
             CustomSinksService service,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("SinksEndpoint");
             logger.LogDebug("API: POST /api/sinks/remap - Creating {SinkName}", request.Name);
             return await ApiExceptionHandler.ExecuteAsync(async () =>
             {
@@ -133,10 +129,8 @@ public static class SinksEndpoint
             string name,
             CustomSinksService service,
             TriggerService triggerService,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("SinksEndpoint");
             logger.LogDebug("API: DELETE /api/sinks/{SinkName}", name);
             var deleted = await service.DeleteSinkAsync(name, ct);
             if (!deleted)
@@ -155,10 +149,8 @@ public static class SinksEndpoint
         group.MapGet("/{name}/status", async (
             string name,
             CustomSinksService service,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("SinksEndpoint");
             logger.LogDebug("API: GET /api/sinks/{SinkName}/status", name);
             var sink = service.GetSink(name);
             if (sink == null)
@@ -180,10 +172,8 @@ public static class SinksEndpoint
         group.MapPost("/{name}/reload", async (
             string name,
             CustomSinksService service,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("SinksEndpoint");
             logger.LogDebug("API: POST /api/sinks/{SinkName}/reload", name);
             var sink = await service.ReloadSinkAsync(name, ct);
             if (sink == null)
@@ -201,10 +191,8 @@ public static class SinksEndpoint
             TestToneRequest? request,
             CustomSinksService service,
             ToneGeneratorService toneGenerator,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("SinksEndpoint");
             logger.LogDebug("API: POST /api/sinks/{SinkName}/test-tone", name);
             return await ApiExceptionHandler.ExecuteAsync(async () =>
             {
@@ -289,9 +277,8 @@ public static class SinksEndpoint
         .WithDescription("Play a test tone through a custom sink for identification");
 
         // GET /api/sinks/import/scan - Scan default.pa for importable sinks
-        group.MapGet("/import/scan", (DefaultPaParser parser, ILoggerFactory loggerFactory) =>
+        group.MapGet("/import/scan", (DefaultPaParser parser) =>
         {
-            var logger = loggerFactory.CreateLogger("SinksEndpoint");
             logger.LogDebug("API: GET /api/sinks/import/scan");
 
             if (!parser.IsAvailable())
@@ -333,10 +320,8 @@ public static class SinksEndpoint
             ImportSinksRequest request,
             DefaultPaParser parser,
             CustomSinksService service,
-            ILoggerFactory loggerFactory,
             CancellationToken ct) =>
         {
-            var logger = loggerFactory.CreateLogger("SinksEndpoint");
             logger.LogDebug("API: POST /api/sinks/import - Importing {Count} sinks", request.LineNumbers.Count);
 
             if (!parser.IsAvailable())
@@ -12,14 +12,15 @@ public static class TriggersEndpoint
 {
     public static void MapTriggersEndpoints(this WebApplication app)
     {
+        var logger = app.Services.GetRequiredService<ILoggerFactory>().CreateLogger("TriggersEndpoint");
+
         var group = app.MapGroup("/api/triggers")
             .WithTags("Triggers")
             .WithOpenApi();
 
         // GET /api/triggers - Get trigger feature status (all boards)
-        group.MapGet("/", (TriggerService service, ILoggerFactory lf) =>
+        group.MapGet("/", (TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: GET /api/triggers");
             var response = service.GetStatus();
             return Results.Ok(response);
@@ -30,10 +31,8 @@ public static class TriggersEndpoint
         // PUT /api/triggers/enabled - Enable or disable the trigger feature (all boards)
         group.MapPut("/enabled", (
             TriggerFeatureEnableRequest request,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: PUT /api/triggers/enabled - {Enabled}", request.Enabled);
 
             var success = service.SetEnabled(request.Enabled);
@@ -54,9 +53,8 @@ public static class TriggersEndpoint
         .WithDescription("Enable or disable the 12V trigger feature for all boards");
 
         // GET /api/triggers/devices - List available FTDI devices (legacy)
-        group.MapGet("/devices", (TriggerService service, ILoggerFactory lf) =>
+        group.MapGet("/devices", (TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: GET /api/triggers/devices");
 
             var devices = service.GetAvailableDevices();
@@ -71,9 +69,8 @@ public static class TriggersEndpoint
         .WithDescription("List available FTDI devices for relay board connection (legacy - use /devices/all for both FTDI and HID)");
 
         // GET /api/triggers/devices/all - List all available relay devices (FTDI, HID, and Modbus)
-        group.MapGet("/devices/all", (TriggerService service, ILoggerFactory lf) =>
+        group.MapGet("/devices/all", (TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: GET /api/triggers/devices/all");
 
             var devices = service.GetAllAvailableDevices();
@@ -94,9 +91,8 @@ public static class TriggersEndpoint
         // ============================================
 
         // GET /api/triggers/boards - List all configured boards
-        group.MapGet("/boards", (TriggerService service, ILoggerFactory lf) =>
+        group.MapGet("/boards", (TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: GET /api/triggers/boards");
 
             var status = service.GetStatus();
@@ -112,10 +108,8 @@ public static class TriggersEndpoint
         // POST /api/triggers/boards - Add a new board
         group.MapPost("/boards", (
             AddBoardRequest request,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: POST /api/triggers/boards - {BoardId}", request.BoardId);
 
             if (string.IsNullOrWhiteSpace(request.BoardId))
@@ -147,10 +141,8 @@ public static class TriggersEndpoint
         // GET /api/triggers/boards/{boardId} - Get specific board status
         group.MapGet("/boards/{boardId}", (
             string boardId,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: GET /api/triggers/boards/{BoardId}", boardId);
 
             var boardStatus = service.GetBoardStatus(boardId);
@@ -168,10 +160,8 @@ public static class TriggersEndpoint
         group.MapPut("/boards/{boardId}", (
             string boardId,
             UpdateBoardRequest request,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: PUT /api/triggers/boards/{BoardId}", boardId);
 
             if (request.ChannelCount.HasValue && !ValidChannelCounts.IsValid(request.ChannelCount.Value))
@@ -197,10 +187,8 @@ public static class TriggersEndpoint
         // DELETE /api/triggers/boards/{boardId} - Remove a board
         group.MapDelete("/boards/{boardId}", (
             string boardId,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: DELETE /api/triggers/boards/{BoardId}", boardId);
 
             var success = service.RemoveBoard(boardId);
@@ -220,10 +208,8 @@ public static class TriggersEndpoint
         // POST /api/triggers/boards/{boardId}/reconnect - Reconnect a specific board
         group.MapPost("/boards/{boardId}/reconnect", (
             string boardId,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: POST /api/triggers/boards/{BoardId}/reconnect", boardId);
 
             var success = service.ReconnectBoard(boardId);
@@ -247,10 +233,8 @@ public static class TriggersEndpoint
         group.MapGet("/boards/{boardId}/{channel:int}", (
             string boardId,
             int channel,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: GET /api/triggers/boards/{BoardId}/{Channel}", boardId, channel);
 
             var boardStatus = service.GetBoardStatus(boardId);
@@ -277,10 +261,8 @@ public static class TriggersEndpoint
             string boardId,
             int channel,
             TriggerConfigureRequest request,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: PUT /api/triggers/boards/{BoardId}/{Channel}", boardId, channel);
 
             // Validate offDelaySeconds
@@ -319,10 +301,8 @@ public static class TriggersEndpoint
         group.MapDelete("/boards/{boardId}/{channel:int}", (
             string boardId,
             int channel,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: DELETE /api/triggers/boards/{BoardId}/{Channel}", boardId, channel);
 
             try
@@ -345,10 +325,8 @@ public static class TriggersEndpoint
             [FromQuery(Name = "boardId")] string boardId,
             [FromQuery(Name = "channel")] int channel,
             RelayManualControlRequest request,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: POST /api/triggers/boards/test?boardId={BoardId}&channel={Channel} - {On}", boardId, channel, request.On);
 
             var boardStatus = service.GetBoardStatus(boardId);
@@ -393,10 +371,8 @@ public static class TriggersEndpoint
             string boardId,
             int channel,
             RelayManualControlRequest request,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: POST /api/triggers/boards/{BoardId}/{Channel}/test - {On}", boardId, channel, request.On);
 
             var boardStatus = service.GetBoardStatus(boardId);
@@ -443,10 +419,8 @@ public static class TriggersEndpoint
         // PUT /api/triggers/channels - Update channel count (legacy - updates first board)
         group.MapPut("/channels", (
             ChannelCountRequest request,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: PUT /api/triggers/channels (legacy) - {ChannelCount}", request.ChannelCount);
 
             if (!ValidChannelCounts.IsValid(request.ChannelCount))
@@ -482,10 +456,8 @@ public static class TriggersEndpoint
         // GET /api/triggers/{channel} - Get single channel status (legacy - first board)
         group.MapGet("/{channel:int}", (
             int channel,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: GET /api/triggers/{Channel} (legacy)", channel);
 
             var status = service.GetStatus();
@@ -512,10 +484,8 @@ public static class TriggersEndpoint
         group.MapPut("/{channel:int}", (
             int channel,
             TriggerConfigureRequest request,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: PUT /api/triggers/{Channel} (legacy)", channel);
 
             var status = service.GetStatus();
@@ -559,10 +529,8 @@ public static class TriggersEndpoint
         // DELETE /api/triggers/{channel} - Unassign a trigger channel (legacy - first board)
         group.MapDelete("/{channel:int}", (
             int channel,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: DELETE /api/triggers/{Channel} (legacy)", channel);
 
             var status = service.GetStatus();
@@ -591,10 +559,8 @@ public static class TriggersEndpoint
         group.MapPost("/{channel:int}/test", (
             int channel,
             RelayManualControlRequest request,
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: POST /api/triggers/{Channel}/test (legacy) - {On}", channel, request.On);
 
             var status = service.GetStatus();
@@ -636,10 +602,8 @@ public static class TriggersEndpoint
 
         // POST /api/triggers/reconnect - Try to reconnect (legacy - reconnects all boards)
         group.MapPost("/reconnect", (
-            TriggerService service,
-            ILoggerFactory lf) =>
+            TriggerService service) =>
         {
-            var logger = lf.CreateLogger("TriggersEndpoint");
             logger.LogDebug("API: POST /api/triggers/reconnect (legacy)");
 
             var status = service.GetStatus();
@@ -12,6 +12,8 @@ namespace MultiRoomAudio.Hubs;
 /// Response Structure: All status updates wrap the players array in an object: { players: [...] }
 /// This matches the frontend JavaScript expectation in wwwroot/js/app.js (line ~58) where
 /// the handler accesses data.players. Do not simplify to send the array directly.
+/// Between full updates the server may send PlayerStatusDelta: { changed: [...], removed: [...] }.
+/// Both carry a sequence number so clients can detect a missed delta and call RequestStatus.
 /// </remarks>
 public class PlayerStatusHub : Hub
 {
@@ -30,9 +32,9 @@ public class PlayerStatusHub : Hub
     {
         _logger.LogDebug("Client connected: {ConnectionId}", Context.ConnectionId);
 
-        // Send current state to newly connected client
-        var players = _playerManager.GetAllPlayers();
-        await Clients.Caller.SendAsync("PlayerStatusUpdate", new { players = players.Players });
+        // Send current state to newly connected client, as of the last broadcast so the
+        // deltas that follow apply to it
+        await Clients.Caller.SendAsync("PlayerStatusUpdate", _playerManager.GetStatusSnapshot());
 
         await base.OnConnectedAsync();
     }
@@ -49,8 +51,7 @@ public class PlayerStatusHub : Hub
     /// </summary>
     public async Task RequestStatus()
     {
-        var players = _playerManager.GetAllPlayers();
-        await Clients.Caller.SendAsync("PlayerStatusUpdate", new { players = players.Players });
+        await Clients.Caller.SendAsync("PlayerStatusUpdate", _playerManager.GetStatusSnapshot());
     }
 }
 
@@ -64,8 +65,20 @@ public static class PlayerStatusHubExtensions
     /// </summary>
     public static async Task BroadcastStatusUpdateAsync(
         this IHubContext<PlayerStatusHub> hubContext,
-        PlayersListResponse players)
+        PlayersListResponse players,
+        long sequence)
     {
-        await hubContext.Clients.All.SendAsync("PlayerStatusUpdate", new { players = players.Players });
+        await hubContext.Clients.All.SendAsync("PlayerStatusUpdate", new PlayerStatusUpdate(players.Players, sequence));
+    }
+
+    /// <summary>
+    /// Broadcasts only the players that changed or were removed since the last update.
+    /// Clients merge this into the snapshot they received via PlayerStatusUpdate.
+    /// </summary>
+    public static async Task BroadcastStatusDeltaAsync(
+        this IHubContext<PlayerStatusHub> hubContext,
+        PlayerStatusDelta delta)
+    {
+        await hubContext.Clients.All.SendAsync("PlayerStatusDelta", delta);
     }
 }
@@ -0,0 +1,23 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace MultiRoomAudio.Models;
+
+/// <summary>
+/// Source-generated JSON metadata for the most frequently serialized payloads:
+/// SignalR status pushes and the player list/status/stats responses the UI polls.
+/// </summary>
+/// <remarks>
+/// Uses web defaults (camelCase) and string enums so the wire format matches the
+/// reflection-based serializer. Types not listed here still serialize via reflection.
+/// </remarks>
+[JsonSourceGenerationOptions(JsonSerializerDefaults.Web, UseStringEnumConverter = true)]
+[JsonSerializable(typeof(PlayerStatusUpdate))]
+[JsonSerializable(typeof(PlayerStatusDelta))]
+[JsonSerializable(typeof(PlayersListResponse))]
+[JsonSerializable(typeof(PlayerResponse))]
+[JsonSerializable(typeof(PlayerStatsResponse))]
+[JsonSerializable(typeof(SuccessResponse))]
+internal partial class ApiJsonContext : JsonSerializerContext
+{
+}
@@ -60,3 +60,23 @@ public record PlayersListResponse(
     List<PlayerResponse> Players,
     int Count
 );
+
+/// <summary>
+/// SignalR payload for PlayerStatusUpdate messages: { players: [...], sequence }.
+/// Sequence is the broadcast the snapshot corresponds to; the next delta carries Sequence + 1.
+/// </summary>
+public record PlayerStatusUpdate(
+    List<PlayerResponse> Players,
+    long Sequence
+);
+
+/// <summary>
+/// SignalR payload for PlayerStatusDelta messages: players whose status changed since the
+/// previous update, and names of players that were removed. A client whose last update
+/// isn't Sequence - 1 has missed one and must request a full snapshot.
+/// </summary>
+public record PlayerStatusDelta(
+    List<PlayerResponse> Changed,
+    List<string> Removed,
+    long Sequence
+);
@@ -1,3 +1,4 @@
+using System.Collections.Frozen;
 using System.ComponentModel.DataAnnotations;
 
 namespace MultiRoomAudio.Models;
@@ -272,6 +273,10 @@ public static class PulseAudioChannels
     public static readonly string[] AllChannels =
         ["front-left", "front-right", "front-center", "lfe", "rear-left", "rear-right", "rear-center", "side-left", "side-right", "mono", "left", "right", "center", "subwoofer"];
 
+    // Case-insensitive hashed lookup over AllChannels, built once for IsValidChannel
+    private static readonly FrozenSet<string> AllChannelsSet =
+        AllChannels.ToFrozenSet(StringComparer.OrdinalIgnoreCase);
+
     /// <summary>
     /// Get channel presets for a given channel count.
     /// </summary>
@@ -293,7 +298,7 @@ public static class PulseAudioChannels
     /// </summary>
     public static bool IsValidChannel(string channel)
     {
-        return AllChannels.Contains(channel, StringComparer.OrdinalIgnoreCase);
+        return AllChannelsSet.Contains(channel);
     }
 
     /// <summary>
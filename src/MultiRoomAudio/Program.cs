@@ -1,4 +1,5 @@
 using System.Text.Json.Serialization;
+using System.Text.Json.Serialization.Metadata;
 using Microsoft.AspNetCore.SignalR;
 using MultiRoomAudio.Audio;
 using MultiRoomAudio.Controllers;
@@ -58,11 +59,34 @@ builder.Services.AddSwaggerGen(c =>
     });
 });
 
+// Compress API JSON, the Swagger document and UI assets (Brotli preferred, gzip fallback).
+// Enabled over HTTPS too: the API has no auth cookies or tokens for BREACH to extract.
+builder.Services.AddResponseCompression(options =>
+{
+    options.EnableForHttps = true;
+    options.Providers.Add<Microsoft.AspNetCore.ResponseCompression.BrotliCompressionProvider>();
+    options.Providers.Add<Microsoft.AspNetCore.ResponseCompression.GzipCompressionProvider>();
+});
+
 // Add SignalR for real-time status updates with string enum serialization
-builder.Services.AddSignalR()
+// Status pushes are event-driven, so idle connections only carry keep-alive pings;
+// a longer ping interval cuts idle traffic for dashboards left open.
+// Client timeouts must stay at least 2x the peer's keep-alive (see setupSignalR in app.js).
+builder.Services.AddSignalR(options =>
+    {
+        options.KeepAliveInterval = TimeSpan.FromSeconds(25);
+        options.ClientTimeoutInterval = TimeSpan.FromSeconds(60);
+    })
     .AddJsonProtocol(options =>
     {
         options.PayloadSerializerOptions.Converters.Add(new JsonStringEnumConverter());
+        // Pushes are mostly idle-player fields that are null (metrics, errors, reconnect info);
+        // leaving them out shrinks every frame, and the UI treats missing and null alike
+        options.PayloadSerializerOptions.DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull;
+        // Status payloads use generated metadata; everything else falls back to reflection
+        options.PayloadSerializerOptions.TypeInfoResolver = JsonTypeInfoResolver.Combine(
+            ApiJsonContext.Default,
+            new DefaultJsonTypeInfoResolver());
     });
 
 // Add CORS for web UI and external access
@@ -87,6 +111,8 @@ builder.Services.AddHealthChecks();
 builder.Services.ConfigureHttpJsonOptions(options =>
 {
     options.SerializerOptions.Converters.Add(new JsonStringEnumConverter());
+    // Frequently polled responses use generated metadata ahead of the reflection resolver
+    options.SerializerOptions.TypeInfoResolverChain.Insert(0, ApiJsonContext.Default);
 });
 
 // Core services (singletons for shared state)
@@ -191,9 +217,15 @@ else if (!int.TryParse(portString, out port) || port < 1 || port > 65535)
     port = DefaultPort;
 }
 
+// API request bodies are small JSON documents; the 30MB Kestrel default is far larger than needed
+const long MaxRequestBodyBytes = 1024 * 1024;
+
 builder.WebHost.ConfigureKestrel(options =>
 {
     options.ListenAnyIP(port);
+    // Oversized bodies are rejected with 413 from Content-Length before any JSON binding runs.
+    // Minimal API binding likewise answers non-JSON content types with 415 without reading the body.
+    options.Limits.MaxRequestBodySize = MaxRequestBodyBytes;
 });
 
 var app = builder.Build();
@@ -209,6 +241,7 @@ if (isMockHardware)
 }
 
 // Configure middleware pipeline
+app.UseResponseCompression();
 app.UseCors("AllowAll");
 
 // Serve static files (wwwroot) with no-cache to ensure UI updates are seen
@@ -219,6 +252,9 @@ app.UseStaticFiles(new StaticFileOptions
     {
         // Disable caching for local static files to ensure UI updates are seen immediately
         // This is appropriate for an admin UI with infrequent access
+        // no-cache means "revalidate", not "don't store": the middleware sends ETag/Last-Modified
+        // and answers matching If-None-Match/If-Modified-Since with 304, so repeat loads
+        // of the (static, client-rendered) UI cost a header round-trip, not the full file
         ctx.Context.Response.Headers.CacheControl = "no-cache, must-revalidate";
     }
 });
@@ -345,7 +381,18 @@ diagnosticsService.RunPulseAudioDiagnostics();
 logger.LogInformation("API documentation available at /docs");
 logger.LogInformation("========================================");
 
-app.Run();
+// No up-front port probe: let Kestrel's own bind be the check and explain the failure
+try
+{
+    app.Run();
+}
+catch (IOException ex) when (ex.InnerException is Microsoft.AspNetCore.Connections.AddressInUseException)
+{
+    logger.LogCritical(
+        "Web port {Port} is already in use. Stop the other process or set WEB_PORT to a free port",
+        port);
+    throw;
+}
 
 // Make Program class accessible for WebApplicationFactory in tests
 public partial class Program { }
@@ -4,7 +4,6 @@ using MultiRoomAudio.Audio.PulseAudio;
 using MultiRoomAudio.Models;
 using MultiRoomAudio.Utilities;
 using YamlDotNet.Serialization;
-using YamlDotNet.Serialization.NamingConventions;
 
 namespace MultiRoomAudio.Services;
 
@@ -24,6 +23,16 @@ public class CardProfileService : IHostedService
     private readonly ISerializer _serializer;
     private readonly ReaderWriterLockSlim _configLock = new(LockRecursionPolicy.NoRecursion);
 
+    /// <summary>
+    /// Longest wait for a card's sinks to appear after a profile change.
+    /// </summary>
+    private static readonly TimeSpan ProfileSinkSettleTimeout = TimeSpan.FromMilliseconds(500);
+
+    /// <summary>
+    /// How often the sink list is rechecked while waiting for a profile change to settle.
+    /// </summary>
+    private static readonly TimeSpan ProfileSinkPollInterval = TimeSpan.FromMilliseconds(50);
+
     public CardProfileService(
         ILogger<CardProfileService> logger,
         EnvironmentService environment,
@@ -41,15 +50,8 @@ public class CardProfileService : IHostedService
         // Configure logger for the enumerator
         PulseAudioCardEnumerator.SetLogger(logger);
 
-        _deserializer = new DeserializerBuilder()
-            .WithNamingConvention(UnderscoredNamingConvention.Instance)
-            .IgnoreUnmatchedProperties()
-            .Build();
-
-        _serializer = new SerializerBuilder()
-            .WithNamingConvention(UnderscoredNamingConvention.Instance)
-            .ConfigureDefaultValuesHandling(DefaultValuesHandling.OmitNull)
-            .Build();
+        _deserializer = YamlSerialization.Deserializer;
+        _serializer = YamlSerialization.Serializer;
     }
 
     /// <summary>
@@ -93,6 +95,7 @@ public class CardProfileService : IHostedService
         }
         var restoredCount = 0;
         var failedCount = 0;
+        var switchedCards = new List<PulseAudioCard>();
 
         foreach (var (cardName, config) in savedProfiles)
         {
@@ -117,8 +120,8 @@ public class CardProfileService : IHostedService
                     _logger.LogDebug(
                         "Card '{CardName}' already at profile '{Profile}'",
                         cardName, config.ProfileName);
-                    restoredCount++;
                     await ApplyBootMutePreferenceAsync(card, defaultUnmute: false, logBootAction: true);
+                    restoredCount++;
                     continue;
                 }
 
@@ -154,8 +157,8 @@ public class CardProfileService : IHostedService
                     _logger.LogInformation(
                         "Restored card '{CardName}' to profile '{Profile}'",
                         cardName, config.ProfileName);
-                    restoredCount++;
-                    await ApplyBootMutePreferenceAsync(card, defaultUnmute: false, logBootAction: true);
+                    // Boot mute is applied (and the card counted) once the new sinks appear, below
+                    switchedCards.Add(card);
                 }
                 else
                 {
@@ -173,6 +176,29 @@ public class CardProfileService : IHostedService
             }
         }
 
+        // Switch every card first, then give them one shared settle window, rather than
+        // each card waiting for its own sinks before the next is switched
+        if (switchedCards.Count > 0)
+        {
+            await WaitForCardSinksAsync(switchedCards);
+
+            foreach (var card in switchedCards)
+            {
+                try
+                {
+                    await ApplyBootMutePreferenceAsync(card, defaultUnmute: false, logBootAction: true);
+                    restoredCount++;
+                }
+                catch (Exception ex)
+                {
+                    _logger.LogError(ex,
+                        "Exception applying boot mute for card '{CardName}' after restoring its profile",
+                        card.Name);
+                    failedCount++;
+                }
+            }
+        }
+
         _logger.LogInformation(
             "CardProfileService started: {Restored} profiles restored, {Failed} failed",
             restoredCount, failedCount);
@@ -202,13 +228,25 @@ public class CardProfileService : IHostedService
             : PulseAudioCardEnumerator.GetCards().ToList();
         var savedProfiles = LoadConfigurations();
 
+        // Gather sink ownership, mute states and device limits in one sweep shared by all
+        // cards, rather than re-running pactl list sinks several times per card
+        var sinksByCard = _environment.IsMockHardware
+            ? MockCardEnumerator.GetSinksGroupedByCard()
+            : PulseAudioCardEnumerator.GetSinksGroupedByCard();
+        var muteStates = _environment.IsMockHardware
+            ? MockCardEnumerator.GetSinksMuteStates()
+            : PulseAudioCardEnumerator.GetSinksMuteStates();
+        var deviceConfigs = _config.GetAllDeviceConfigurations();
+        var devicesById = IndexDevicesById(_backend.GetOutputDevices());
+
         return cards.Select(card =>
         {
             var config = savedProfiles.GetValueOrDefault(card.Name);
-            var isMuted = GetCardMuteState(card);
+            var sinks = sinksByCard.GetValueOrDefault(card.Index) ?? new List<string>();
+            var isMuted = GetCardMuteState(card, sinks, muteStates);
             var bootMuted = config?.BootMuted;
             var bootMatches = bootMuted.HasValue && isMuted.HasValue && bootMuted.Value == isMuted.Value;
-            var maxVolume = GetCardMaxVolume(card);
+            var maxVolume = GetCardMaxVolume(card, sinks, deviceConfigs, devicesById);
 
             return card with
             {
@@ -265,10 +303,18 @@ public class CardProfileService : IHostedService
 
         var previousProfile = card.ActiveProfile;
 
-        // Attempt to change the profile
-        var success = _environment.IsMockHardware
-            ? MockCardEnumerator.SetCardProfile(card.Name, profileName, out var error)
-            : PulseAudioCardEnumerator.SetCardProfile(card.Name, profileName, out error);
+        // Attempt to change the profile (real hardware goes through async pactl so the
+        // request thread isn't parked on the process)
+        bool success;
+        string? error;
+        if (_environment.IsMockHardware)
+        {
+            success = MockCardEnumerator.SetCardProfile(card.Name, profileName, out error);
+        }
+        else
+        {
+            (success, error) = await PulseAudioCardEnumerator.SetCardProfileAsync(card.Name, profileName);
+        }
 
         if (!success)
         {
@@ -288,7 +334,7 @@ public class CardProfileService : IHostedService
             card.Name, previousProfile, profileName);
 
         // Give PulseAudio a moment to create the new sinks
-        await Task.Delay(500);
+        await WaitForCardSinksAsync(card);
 
         await ApplyBootMutePreferenceAsync(card, defaultUnmute: true);
 
@@ -301,15 +347,6 @@ public class CardProfileService : IHostedService
         );
     }
 
-    /// <summary>
-    /// Sets the active profile for a card and persists the selection.
-    /// Synchronous wrapper for backwards compatibility.
-    /// </summary>
-    public CardProfileResponse SetCardProfile(string cardNameOrIndex, string profileName)
-    {
-        return SetCardProfileAsync(cardNameOrIndex, profileName).GetAwaiter().GetResult();
-    }
-
     /// <summary>
     /// Gets all saved profile configurations.
     /// </summary>
@@ -477,6 +514,9 @@ public class CardProfileService : IHostedService
 
         var displayName = GetCardDisplayName(card);
 
+        // Enumerate devices once for the whole card rather than once per sink
+        var devicesById = IndexDevicesById(_backend.GetOutputDevices());
+
         // Apply volume limit to all sinks
         var failed = new List<string>();
         foreach (var sinkName in sinks)
@@ -494,9 +534,7 @@ public class CardProfileService : IHostedService
                 }
 
                 // Save to device configuration for each sink
-                var devices = _backend.GetOutputDevices();
-                var device = devices.FirstOrDefault(d => d.Id == sinkName);
-                if (device != null)
+                if (devicesById.TryGetValue(sinkName, out var device))
                 {
                     var deviceKey = ConfigurationService.GenerateDeviceKey(device);
                     _config.SetDeviceMaxVolume(deviceKey, maxVolume, device);
@@ -645,11 +683,7 @@ public class CardProfileService : IHostedService
         // Write file outside the lock
         try
         {
-            var dir = Path.GetDirectoryName(_configPath);
-            if (!string.IsNullOrEmpty(dir) && !Directory.Exists(dir))
-            {
-                Directory.CreateDirectory(dir);
-            }
+            _environment.EnsureDirectoriesExist();
 
             File.WriteAllText(_configPath, yamlToWrite);
             _logger.LogDebug("Saved card profile configuration for '{CardName}'", cardName);
@@ -787,11 +821,7 @@ public class CardProfileService : IHostedService
         // Write file outside the lock
         try
         {
-            var dir = Path.GetDirectoryName(_configPath);
-            if (!string.IsNullOrEmpty(dir) && !Directory.Exists(dir))
-            {
-                Directory.CreateDirectory(dir);
-            }
+            _environment.EnsureDirectoriesExist();
 
             File.WriteAllText(_configPath, yamlToWrite);
             _logger.LogDebug("Saved boot mute configuration for '{CardName}'", cardName);
@@ -802,9 +832,16 @@ public class CardProfileService : IHostedService
         }
     }
 
-    private bool? GetCardMuteState(PulseAudioCard card)
+    /// <summary>
+    /// Determines a card's mute state from its sinks. Sinks and mute states are queried
+    /// when not supplied; callers covering many cards pass them in from one sweep.
+    /// </summary>
+    private bool? GetCardMuteState(
+        PulseAudioCard card,
+        List<string>? sinks = null,
+        IReadOnlyDictionary<string, bool>? muteStates = null)
     {
-        var sinks = _environment.IsMockHardware
+        sinks ??= _environment.IsMockHardware
             ? MockCardEnumerator.GetSinksByCard(card.Index)
             : PulseAudioCardEnumerator.GetSinksByCard(card.Index);
         if (sinks.Count == 0)
@@ -814,9 +851,9 @@ public class CardProfileService : IHostedService
 
         try
         {
-            var output = _environment.IsMockHardware
+            var output = muteStates ?? (_environment.IsMockHardware
                 ? MockCardEnumerator.GetSinksMuteStates()
-                : PulseAudioCardEnumerator.GetSinksMuteStates();
+                : PulseAudioCardEnumerator.GetSinksMuteStates());
             if (output.Count == 0)
             {
                 return null;
@@ -845,9 +882,17 @@ public class CardProfileService : IHostedService
         }
     }
 
-    private int? GetCardMaxVolume(PulseAudioCard card)
+    /// <summary>
+    /// Finds the max volume configured for any of a card's sinks. Inputs not supplied are
+    /// queried; callers covering many cards pass them in from one sweep.
+    /// </summary>
+    private int? GetCardMaxVolume(
+        PulseAudioCard card,
+        List<string>? sinks = null,
+        IReadOnlyDictionary<string, DeviceConfiguration>? deviceConfigs = null,
+        Dictionary<string, AudioDevice>? devicesById = null)
     {
-        var sinks = _environment.IsMockHardware
+        sinks ??= _environment.IsMockHardware
             ? MockCardEnumerator.GetSinksByCard(card.Index)
             : PulseAudioCardEnumerator.GetSinksByCard(card.Index);
         if (sinks.Count == 0)
@@ -858,14 +903,13 @@ public class CardProfileService : IHostedService
         try
         {
             // Get all device configurations
-            var deviceConfigs = _config.GetAllDeviceConfigurations();
-            var devices = _backend.GetOutputDevices();
+            deviceConfigs ??= _config.GetAllDeviceConfigurations();
+            devicesById ??= IndexDevicesById(_backend.GetOutputDevices());
 
             // Find the first sink that has a max volume configured
             foreach (var sinkName in sinks)
             {
-                var device = devices.FirstOrDefault(d => d.Id == sinkName);
-                if (device != null)
+                if (devicesById.TryGetValue(sinkName, out var device))
                 {
                     var deviceKey = ConfigurationService.GenerateDeviceKey(device);
                     if (deviceConfigs.TryGetValue(deviceKey, out var config) && config.MaxVolume.HasValue)
@@ -884,6 +928,33 @@ public class CardProfileService : IHostedService
         }
     }
 
+    /// <summary>
+    /// Waits until the card exposes at least one sink, or <see cref="ProfileSinkSettleTimeout"/>
+    /// elapses (e.g. for the "off" profile, which has none).
+    /// </summary>
+    private Task WaitForCardSinksAsync(PulseAudioCard card) => WaitForCardSinksAsync([card]);
+
+    /// <summary>
+    /// Waits until every card exposes at least one sink, sharing a single
+    /// <see cref="ProfileSinkSettleTimeout"/> window and one sink sweep per poll.
+    /// </summary>
+    private async Task WaitForCardSinksAsync(IReadOnlyList<PulseAudioCard> cards)
+    {
+        var deadline = Environment.TickCount64 + (long)ProfileSinkSettleTimeout.TotalMilliseconds;
+        while (true)
+        {
+            var sinksByCard = _environment.IsMockHardware
+                ? MockCardEnumerator.GetSinksGroupedByCard()
+                : PulseAudioCardEnumerator.GetSinksGroupedByCard();
+            if (cards.All(c => sinksByCard.ContainsKey(c.Index)) || Environment.TickCount64 >= deadline)
+            {
+                return;
+            }
+
+            await Task.Delay(ProfileSinkPollInterval);
+        }
+    }
+
     private async Task ApplyBootMutePreferenceAsync(PulseAudioCard card, bool defaultUnmute, bool logBootAction = false)
     {
         var savedProfiles = LoadConfigurations();
@@ -954,6 +1025,23 @@ public class CardProfileService : IHostedService
         }
     }
 
+    /// <summary>
+    /// Builds a sink-name lookup for the given devices, skipping entries without an ID.
+    /// </summary>
+    private static Dictionary<string, AudioDevice> IndexDevicesById(IEnumerable<AudioDevice> devices)
+    {
+        var byId = new Dictionary<string, AudioDevice>();
+        foreach (var device in devices)
+        {
+            if (!string.IsNullOrEmpty(device.Id))
+            {
+                // First match wins, as with the FirstOrDefault lookups this replaces
+                byId.TryAdd(device.Id, device);
+            }
+        }
+        return byId;
+    }
+
     private static string GetCardDisplayName(PulseAudioCard card)
     {
         return string.IsNullOrWhiteSpace(card.Description) ? card.Name : card.Description;
@@ -1,6 +1,6 @@
 using MultiRoomAudio.Models;
+using MultiRoomAudio.Utilities;
 using YamlDotNet.Serialization;
-using YamlDotNet.Serialization.NamingConventions;
 
 namespace MultiRoomAudio.Services;
 
@@ -107,8 +107,14 @@ public class PlayerConfiguration
 /// Manages player configuration persistence with YAML storage.
 /// Provides a clean interface for configuration operations.
 /// </summary>
-public class ConfigurationService
+public class ConfigurationService : IDisposable
 {
+    /// <summary>
+    /// Quiet period before a requested save is written.
+    /// Bursts of changes (e.g. dragging a slider) collapse into one write.
+    /// </summary>
+    private static readonly TimeSpan SaveDebounceDelay = TimeSpan.FromMilliseconds(250);
+
     private readonly ILogger<ConfigurationService> _logger;
     private readonly EnvironmentService _environment;
     private readonly string _playersConfigPath;
@@ -116,10 +122,33 @@ public class ConfigurationService
     private readonly IDeserializer _deserializer;
     private readonly ISerializer _serializer;
     private readonly ReaderWriterLockSlim _lock = new(LockRecursionPolicy.NoRecursion);
+    // Serializes snapshot + file write for each YAML file, so a debounced Save() racing a
+    // synchronous one can't rename an older snapshot over a newer one
+    private readonly object _playersFileLock = new();
+    private readonly object _devicesFileLock = new();
 
     private Dictionary<string, PlayerConfiguration> _players = new();
     private Dictionary<string, DeviceConfiguration> _devices = new();
 
+    // Immutable snapshots of _players handed out to pollers (status broadcasts, listings).
+    // Cleared whenever players are added, removed, renamed or reloaded; rebuilt on next read.
+    private IReadOnlyDictionary<string, PlayerConfiguration>? _playersSnapshot;
+    private IReadOnlyList<string>? _playerNamesSnapshot;
+
+    // Bumped on every change to player configuration, including in-place field updates,
+    // so consumers caching data derived from it can tell when to rebuild.
+    private long _playersVersion;
+
+    // Reverse index of _devices by LastKnownSinkName, rebuilt whenever device entries change.
+    // Device enrichment looks configs up by sink name for every sink on every device listing.
+    private Dictionary<string, DeviceConfiguration> _devicesBySinkName = new(StringComparer.OrdinalIgnoreCase);
+
+    private readonly Timer _saveTimer;
+    // Guards _disposed against _saveTimer so a request never re-arms a disposed timer
+    private readonly object _saveTimerLock = new();
+    private int _savePending;
+    private bool _disposed;
+
     public ConfigurationService(
         ILogger<ConfigurationService> logger,
         EnvironmentService environment)
@@ -132,15 +161,10 @@ public class ConfigurationService
         _logger.LogDebug("Initializing ConfigurationService with players config: {PlayersPath}, devices config: {DevicesPath}",
             _playersConfigPath, _devicesConfigPath);
 
-        _deserializer = new DeserializerBuilder()
-            .WithNamingConvention(UnderscoredNamingConvention.Instance)
-            .IgnoreUnmatchedProperties()
-            .Build();
+        _deserializer = YamlSerialization.Deserializer;
+        _serializer = YamlSerialization.Serializer;
 
-        _serializer = new SerializerBuilder()
-            .WithNamingConvention(UnderscoredNamingConvention.Instance)
-            .ConfigureDefaultValuesHandling(DefaultValuesHandling.OmitNull)
-            .Build();
+        _saveTimer = new Timer(_ => FlushPendingSave(), null, Timeout.Infinite, Timeout.Infinite);
 
         _environment.EnsureDirectoriesExist();
         Load();
@@ -243,7 +267,7 @@ public class ConfigurationService
             _logger.LogInformation("Loaded {PlayerCount} players from configuration", _players.Count);
 
             // Log player names at debug level for troubleshooting
-            if (_players.Count > 0)
+            if (_players.Count > 0 && _logger.IsEnabled(LogLevel.Debug))
             {
                 _logger.LogDebug("Configured players: {PlayerNames}",
                     string.Join(", ", _players.Keys));
@@ -263,6 +287,7 @@ public class ConfigurationService
         }
         finally
         {
+            InvalidatePlayersSnapshot();
             _lock.ExitWriteLock();
         }
     }
@@ -272,40 +297,79 @@ public class ConfigurationService
     /// </summary>
     public bool Save()
     {
-        // Serialize under read lock (we're only reading _players)
-        string yaml;
-        int playerCount;
-        _lock.EnterReadLock();
-        try
-        {
-            _logger.LogDebug("Saving {PlayerCount} players to configuration", _players.Count);
-            yaml = _serializer.Serialize(_players);
-            playerCount = _players.Count;
-        }
-        finally
-        {
-            _lock.ExitReadLock();
-        }
+        // This write covers any debounced save that is still waiting
+        Interlocked.Exchange(ref _savePending, 0);
 
-        // Write file outside the lock
-        try
+        lock (_playersFileLock)
         {
-            File.WriteAllText(_playersConfigPath, yaml);
-            _logger.LogInformation("Configuration saved successfully ({PlayerCount} players)",
-                playerCount);
-            return true;
+            // Serialize under read lock (we're only reading _players)
+            string yaml;
+            int playerCount;
+            _lock.EnterReadLock();
+            try
+            {
+                _logger.LogDebug("Saving {PlayerCount} players to configuration", _players.Count);
+                yaml = _serializer.Serialize(_players);
+                playerCount = _players.Count;
+            }
+            finally
+            {
+                _lock.ExitReadLock();
+            }
+
+            // Write file outside the state lock (still under the file lock)
+            try
+            {
+                AtomicFile.WriteAllText(_playersConfigPath, yaml);
+
+                _logger.LogInformation("Configuration saved successfully ({PlayerCount} players)",
+                    playerCount);
+                return true;
+            }
+            catch (IOException ex)
+            {
+                _logger.LogError(ex,
+                    "Failed to write configuration file {ConfigPath}. Check disk space and permissions",
+                    _playersConfigPath);
+                return false;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Unexpected error saving config to {ConfigPath}", _playersConfigPath);
+                return false;
+            }
         }
-        catch (IOException ex)
+    }
+
+    /// <summary>
+    /// Schedule a save of player configurations after a short quiet period.
+    /// Use for high-frequency, non-critical changes; repeated calls within
+    /// <see cref="SaveDebounceDelay"/> result in a single write.
+    /// </summary>
+    public void RequestSave()
+    {
+        lock (_saveTimerLock)
         {
-            _logger.LogError(ex,
-                "Failed to write configuration file {ConfigPath}. Check disk space and permissions",
-                _playersConfigPath);
-            return false;
+            if (!_disposed)
+            {
+                Interlocked.Exchange(ref _savePending, 1);
+                _saveTimer.Change(SaveDebounceDelay, Timeout.InfiniteTimeSpan);
+                return;
+            }
         }
-        catch (Exception ex)
+
+        // Already disposed, so there is no timer left to debounce through
+        Save();
+    }
+
+    /// <summary>
+    /// Write a pending debounced save, if any.
+    /// </summary>
+    private void FlushPendingSave()
+    {
+        if (Interlocked.Exchange(ref _savePending, 0) == 1)
         {
-            _logger.LogError(ex, "Unexpected error saving config to {ConfigPath}", _playersConfigPath);
-            return false;
+            Save();
         }
     }
 
@@ -336,6 +400,7 @@ public class ConfigurationService
             var isUpdate = _players.ContainsKey(name);
             config.Name = name;
             _players[name] = config;
+            InvalidatePlayersSnapshot();
 
             if (isUpdate)
             {
@@ -366,6 +431,7 @@ public class ConfigurationService
         {
             if (_players.Remove(name))
             {
+                InvalidatePlayersSnapshot();
                 _logger.LogInformation("Deleted player configuration: {PlayerName}", name);
                 return true;
             }
@@ -397,13 +463,14 @@ public class ConfigurationService
 
     /// <summary>
     /// Get list of all player names.
+    /// Returns a cached read-only snapshot that is rebuilt only after the player set changes.
     /// </summary>
     public IReadOnlyList<string> ListPlayers()
     {
         _lock.EnterReadLock();
         try
         {
-            return _players.Keys.ToList();
+            return _playerNamesSnapshot ??= _players.Keys.ToList().AsReadOnly();
         }
         finally
         {
@@ -411,6 +478,38 @@ public class ConfigurationService
         }
     }
 
+    /// <summary>
+    /// Get a snapshot of all player configurations, taken under a single lock.
+    /// The snapshot is cached and shared between callers until the player set changes.
+    /// </summary>
+    public IReadOnlyDictionary<string, PlayerConfiguration> GetAllPlayerConfigurations()
+    {
+        _lock.EnterReadLock();
+        try
+        {
+            return _playersSnapshot ??= new Dictionary<string, PlayerConfiguration>(_players).AsReadOnly();
+        }
+        finally
+        {
+            _lock.ExitReadLock();
+        }
+    }
+
+    /// <summary>
+    /// Drop cached player snapshots. Must be called under the write lock.
+    /// </summary>
+    private void InvalidatePlayersSnapshot()
+    {
+        _playersSnapshot = null;
+        _playerNamesSnapshot = null;
+        Interlocked.Increment(ref _playersVersion);
+    }
+
+    /// <summary>
+    /// Changes whenever any player configuration is added, removed, renamed, reloaded or edited.
+    /// </summary>
+    public long PlayersVersion => Interlocked.Read(ref _playersVersion);
+
     /// <summary>
     /// Update a single field in a player's configuration and optionally save.
     /// </summary>
@@ -423,6 +522,8 @@ public class ConfigurationService
                 return false;
 
             update(config);
+            // The snapshot shares these objects so stays valid, but derived data doesn't
+            Interlocked.Increment(ref _playersVersion);
             _logger.LogDebug("Updated player config field: {Name}", name);
         }
         finally
@@ -461,15 +562,15 @@ public class ConfigurationService
         _lock.EnterWriteLock();
         try
         {
-            if (!_players.TryGetValue(oldName, out var config))
+            if (oldName != newName && _players.ContainsKey(newName))
                 return false;
 
-            if (_players.ContainsKey(newName) && oldName != newName)
+            if (!_players.Remove(oldName, out var config))
                 return false;
 
-            _players.Remove(oldName);
             config.Name = newName;
             _players[newName] = config;
+            InvalidatePlayersSnapshot();
 
             _logger.LogDebug("Renamed player: {OldName} -> {NewName}", oldName, newName);
             return true;
@@ -548,6 +649,7 @@ public class ConfigurationService
         }
         finally
         {
+            RebuildSinkNameIndex();
             _lock.ExitWriteLock();
         }
     }
@@ -557,32 +659,35 @@ public class ConfigurationService
     /// </summary>
     public bool SaveDevices()
     {
-        // Serialize under read lock
-        string yaml;
-        int deviceCount;
-        _lock.EnterReadLock();
-        try
-        {
-            _logger.LogDebug("Saving {DeviceCount} devices to configuration", _devices.Count);
-            yaml = _serializer.Serialize(_devices);
-            deviceCount = _devices.Count;
-        }
-        finally
+        lock (_devicesFileLock)
         {
-            _lock.ExitReadLock();
-        }
+            // Serialize under read lock
+            string yaml;
+            int deviceCount;
+            _lock.EnterReadLock();
+            try
+            {
+                _logger.LogDebug("Saving {DeviceCount} devices to configuration", _devices.Count);
+                yaml = _serializer.Serialize(_devices);
+                deviceCount = _devices.Count;
+            }
+            finally
+            {
+                _lock.ExitReadLock();
+            }
 
-        // Write file outside the lock
-        try
-        {
-            File.WriteAllText(_devicesConfigPath, yaml);
-            _logger.LogDebug("Device configuration saved successfully ({DeviceCount} devices)", deviceCount);
-            return true;
-        }
-        catch (Exception ex)
-        {
-            _logger.LogError(ex, "Failed to save device configuration to {ConfigPath}", _devicesConfigPath);
-            return false;
+            // Write file outside the state lock (still under the file lock)
+            try
+            {
+                AtomicFile.WriteAllText(_devicesConfigPath, yaml);
+                _logger.LogDebug("Device configuration saved successfully ({DeviceCount} devices)", deviceCount);
+                return true;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Failed to save device configuration to {ConfigPath}", _devicesConfigPath);
+                return false;
+            }
         }
     }
 
@@ -611,6 +716,7 @@ public class ConfigurationService
         try
         {
             _devices[deviceKey] = config;
+            RebuildSinkNameIndex();
             _logger.LogDebug("Set device configuration: {DeviceKey}, Alias={Alias}",
                 deviceKey, config.Alias ?? "(none)");
         }
@@ -629,9 +735,7 @@ public class ConfigurationService
         _lock.EnterReadLock();
         try
         {
-            var device = _devices.Values.FirstOrDefault(d =>
-                d.LastKnownSinkName?.Equals(sinkName, StringComparison.OrdinalIgnoreCase) == true);
-            return device?.Alias;
+            return _devicesBySinkName.TryGetValue(sinkName, out var device) ? device.Alias : null;
         }
         finally
         {
@@ -647,8 +751,7 @@ public class ConfigurationService
         _lock.EnterReadLock();
         try
         {
-            return _devices.Values.FirstOrDefault(d =>
-                d.LastKnownSinkName?.Equals(sinkName, StringComparison.OrdinalIgnoreCase) == true);
+            return _devicesBySinkName.TryGetValue(sinkName, out var device) ? device : null;
         }
         finally
         {
@@ -656,6 +759,22 @@ public class ConfigurationService
         }
     }
 
+    /// <summary>
+    /// Rebuilds the sink name index from _devices. Caller must hold the write lock.
+    /// The first device claiming a sink name wins, matching the previous linear scan.
+    /// </summary>
+    private void RebuildSinkNameIndex()
+    {
+        var index = new Dictionary<string, DeviceConfiguration>(StringComparer.OrdinalIgnoreCase);
+        foreach (var device in _devices.Values)
+        {
+            if (!string.IsNullOrEmpty(device.LastKnownSinkName))
+                index.TryAdd(device.LastKnownSinkName, device);
+        }
+
+        _devicesBySinkName = index;
+    }
+
     /// <summary>
     /// Generic helper method for updating a device property.
     /// Handles loading/creating the device config, updating the property, and saving.
@@ -698,6 +817,8 @@ public class ConfigurationService
                 config.Identifiers = DeviceIdentifiersConfig.FromModel(currentDevice.Identifiers);
             }
 
+            RebuildSinkNameIndex();
+
             var formattedValue = formatValue != null ? formatValue(value) : value?.ToString() ?? "(null)";
             _logger.LogInformation("Set device {PropertyName}: {DeviceKey} = {Value}",
                 propertyName, deviceKey, formattedValue);
@@ -815,6 +936,7 @@ public class ConfigurationService
             config.LastKnownSinkName = device.Id;
             config.LastSeen = DateTime.UtcNow;
             config.Identifiers = DeviceIdentifiersConfig.FromModel(device.Identifiers);
+            RebuildSinkNameIndex();
         }
         finally
         {
@@ -855,4 +977,21 @@ public class ConfigurationService
             _lock.ExitReadLock();
         }
     }
+
+    /// <summary>
+    /// Flushes any pending debounced save.
+    /// </summary>
+    public void Dispose()
+    {
+        lock (_saveTimerLock)
+        {
+            if (_disposed)
+                return;
+
+            _disposed = true;
+            _saveTimer.Dispose();
+        }
+
+        FlushPendingSave();
+    }
 }
@@ -3,7 +3,6 @@ using MultiRoomAudio.Exceptions;
 using MultiRoomAudio.Models;
 using MultiRoomAudio.Utilities;
 using YamlDotNet.Serialization;
-using YamlDotNet.Serialization.NamingConventions;
 
 namespace MultiRoomAudio.Services;
 
@@ -46,15 +45,8 @@ public class CustomSinksService : IHostedService, IAsyncDisposable
         _environment = environment;
         _configPath = Path.Combine(environment.ConfigPath, "custom-sinks.yaml");
 
-        _deserializer = new DeserializerBuilder()
-            .WithNamingConvention(UnderscoredNamingConvention.Instance)
-            .IgnoreUnmatchedProperties()
-            .Build();
-
-        _serializer = new SerializerBuilder()
-            .WithNamingConvention(UnderscoredNamingConvention.Instance)
-            .ConfigureDefaultValuesHandling(DefaultValuesHandling.OmitNull)
-            .Build();
+        _deserializer = YamlSerialization.Deserializer;
+        _serializer = YamlSerialization.Serializer;
     }
 
     /// <summary>
@@ -43,7 +43,16 @@ public class DeviceMatchingService
     /// </summary>
     public string? FindCurrentSinkName(DeviceConfiguration persistedDevice)
     {
-        var devices = _backend.GetOutputDevices().ToList();
+        return FindCurrentSinkName(persistedDevice, _backend.GetOutputDevices().ToList());
+    }
+
+    /// <summary>
+    /// Attempts to find the current sink name for a persisted device configuration
+    /// against an already-enumerated device list, so callers matching many devices
+    /// enumerate sinks once.
+    /// </summary>
+    private string? FindCurrentSinkName(DeviceConfiguration persistedDevice, IReadOnlyList<AudioDevice> devices)
+    {
         var identifiers = persistedDevice.Identifiers;
 
         if (identifiers == null && string.IsNullOrEmpty(persistedDevice.LastKnownSinkName))
@@ -159,11 +168,12 @@ public class DeviceMatchingService
     public List<DeviceMatchResult> MatchAllDevices()
     {
         var results = new List<DeviceMatchResult>();
-        var devices = _backend.GetOutputDevices().ToDictionary(d => d.Id, StringComparer.OrdinalIgnoreCase);
+        var deviceList = _backend.GetOutputDevices().ToList();
+        var devices = deviceList.ToDictionary(d => d.Id, StringComparer.OrdinalIgnoreCase);
 
         foreach (var (deviceKey, persisted) in _config.Devices)
         {
-            var currentSinkName = FindCurrentSinkName(persisted);
+            var currentSinkName = FindCurrentSinkName(persisted, deviceList);
             var wasUpdated = false;
             string? matchMethod = null;
 
@@ -19,6 +19,8 @@ public class EnvironmentService
     private readonly string _configPath;
     private readonly string _logPath;
     private readonly Dictionary<string, JsonElement>? _haosOptions;
+    private readonly object _directoriesLock = new();
+    private volatile bool _directoriesEnsured;
 
     public const string EnvStandalone = "standalone";
     public const string EnvHaos = "haos";
@@ -170,40 +172,44 @@ public class EnvironmentService
     public string VolumeControlMethod => "pactl";
 
     /// <summary>
-    /// Ensure required directories exist.
+    /// Ensure required directories (config and log) exist.
+    /// The check runs once per process; later calls return immediately.
     /// </summary>
     public void EnsureDirectoriesExist()
     {
-        _logger.LogDebug("Ensuring required directories exist");
+        if (_directoriesEnsured)
+            return;
 
-        try
+        lock (_directoriesLock)
         {
-            if (!Directory.Exists(_configPath))
-            {
-                Directory.CreateDirectory(_configPath);
-                _logger.LogInformation("Created config directory: {ConfigPath}", _configPath);
-            }
-            else
-            {
-                _logger.LogDebug("Config directory exists: {ConfigPath}", _configPath);
-            }
+            if (_directoriesEnsured)
+                return;
+
+            _logger.LogDebug("Ensuring required directories exist");
 
-            if (!Directory.Exists(_logPath))
+            try
             {
-                Directory.CreateDirectory(_logPath);
-                _logger.LogInformation("Created log directory: {LogPath}", _logPath);
+                foreach (var (kind, path) in new[] { ("config", _configPath), ("log", _logPath) })
+                {
+                    if (Directory.Exists(path))
+                    {
+                        _logger.LogDebug("{Kind} directory exists: {Path}", kind, path);
+                        continue;
+                    }
+
+                    Directory.CreateDirectory(path);
+                    _logger.LogInformation("Created {Kind} directory: {Path}", kind, path);
+                }
+
+                _directoriesEnsured = true;
             }
-            else
+            catch (Exception ex)
             {
-                _logger.LogDebug("Log directory exists: {LogPath}", _logPath);
+                _logger.LogError(ex,
+                    "Failed to create directories. ConfigPath: {ConfigPath}, LogPath: {LogPath}",
+                    _configPath, _logPath);
             }
         }
-        catch (Exception ex)
-        {
-            _logger.LogError(ex,
-                "Failed to create directories. ConfigPath: {ConfigPath}, LogPath: {LogPath}",
-                _configPath, _logPath);
-        }
     }
 
     private static bool IsDirectoryWritable(string path)
@@ -273,7 +279,7 @@ public class EnvironmentService
             var json = File.ReadAllText(HaosOptionsFile);
             var options = JsonSerializer.Deserialize<Dictionary<string, JsonElement>>(json);
 
-            if (options != null)
+            if (options != null && _logger.IsEnabled(LogLevel.Debug))
             {
                 _logger.LogDebug("Successfully loaded HAOS options: {Keys}",
                     string.Join(", ", options.Keys));
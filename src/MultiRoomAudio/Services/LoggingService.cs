@@ -52,12 +52,22 @@ public class LoggingService : IDisposable
     private readonly object _bufferLock = new();
     private StreamWriter? _fileWriter;
     private string? _currentLogFilePath;
+    // Rotation targets multiroom-audio.1.log .. .N.log, resolved once with the current path
+    private string[] _rotatedLogFilePaths = Array.Empty<string>();
+    // Bytes in the current log file, tracked as lines are written so rotation
+    // doesn't have to stat the file on every entry. Guarded by _fileLock.
+    private long _currentLogFileBytes;
+    // Writes are buffered; this timer pushes them to disk shortly after they're made
+    // instead of issuing a flush per line. Guarded by _fileLock.
+    private readonly Timer _flushTimer;
+    private bool _flushPending;
     private bool _disposed;
 
     private const int InMemoryBufferSize = 2000;
     private const long MaxLogFileSizeBytes = 10 * 1024 * 1024; // 10MB
     private const int MaxLogFileCount = 5;
     private const string LogFileName = "multiroom-audio.log";
+    private static readonly TimeSpan FlushInterval = TimeSpan.FromSeconds(1);
 
     /// <summary>
     /// Event fired when a new log entry is added.
@@ -68,6 +78,7 @@ public class LoggingService : IDisposable
     {
         _environment = environment;
         _buffer = new CircularBuffer<LogEntry>(InMemoryBufferSize);
+        _flushTimer = new Timer(_ => FlushFile(), null, FlushInterval, FlushInterval);
 
         InitializeFileLogging();
     }
@@ -76,17 +87,18 @@ public class LoggingService : IDisposable
     {
         try
         {
+            _environment.EnsureDirectoriesExist();
             var logDir = _environment.LogPath;
-            if (!Directory.Exists(logDir))
-            {
-                Directory.CreateDirectory(logDir);
-            }
 
             _currentLogFilePath = Path.Combine(logDir, LogFileName);
+            _rotatedLogFilePaths = Enumerable.Range(1, MaxLogFileCount)
+                .Select(i => Path.Combine(logDir, $"multiroom-audio.{i}.log"))
+                .ToArray();
             _fileWriter = new StreamWriter(_currentLogFilePath, append: true, Encoding.UTF8)
             {
-                AutoFlush = true
+                AutoFlush = false
             };
+            _currentLogFileBytes = _fileWriter.BaseStream.Length;
         }
         catch (Exception)
         {
@@ -306,11 +318,42 @@ public class LoggingService : IDisposable
                 // Format: 2026-01-10T14:23:45.123Z|INFO|Player|Message|Exception
                 var line = FormatLogLine(entry);
                 _fileWriter.WriteLine(line);
+                _currentLogFileBytes += Encoding.UTF8.GetByteCount(line) + Environment.NewLine.Length;
+
+                // Warnings and errors go to disk immediately in case the process is about to die
+                if (entry.Level >= LogLevel.Warning)
+                {
+                    _fileWriter.Flush();
+                    _flushPending = false;
+                }
+                else
+                {
+                    _flushPending = true;
+                }
+            }
+            catch
+            {
+                // Ignore file write errors
+            }
+        }
+    }
+
+    private void FlushFile()
+    {
+        lock (_fileLock)
+        {
+            if (!_flushPending || _fileWriter == null)
+                return;
+
+            try
+            {
+                _fileWriter.Flush();
             }
             catch
             {
                 // Ignore file write errors
             }
+            _flushPending = false;
         }
     }
 
@@ -336,11 +379,7 @@ public class LoggingService : IDisposable
 
     private void RotateLogFileIfNeeded()
     {
-        if (_currentLogFilePath == null || !File.Exists(_currentLogFilePath))
-            return;
-
-        var fileInfo = new FileInfo(_currentLogFilePath);
-        if (fileInfo.Length < MaxLogFileSizeBytes)
+        if (_currentLogFilePath == null || _currentLogFileBytes < MaxLogFileSizeBytes)
             return;
 
         try
@@ -348,13 +387,11 @@ public class LoggingService : IDisposable
             _fileWriter?.Dispose();
             _fileWriter = null;
 
-            var logDir = _environment.LogPath;
-
             // Shift existing files: 4->delete, 3->4, 2->3, 1->2, current->1
             for (int i = MaxLogFileCount - 1; i >= 1; i--)
             {
-                var oldPath = Path.Combine(logDir, $"multiroom-audio.{i}.log");
-                var newPath = Path.Combine(logDir, $"multiroom-audio.{i + 1}.log");
+                var oldPath = _rotatedLogFilePaths[i - 1];
+                var newPath = _rotatedLogFilePaths[i];
 
                 if (File.Exists(newPath))
                 {
@@ -367,14 +404,14 @@ public class LoggingService : IDisposable
             }
 
             // Move current to .1
-            var rotatedPath = Path.Combine(logDir, "multiroom-audio.1.log");
-            File.Move(_currentLogFilePath, rotatedPath);
+            File.Move(_currentLogFilePath, _rotatedLogFilePaths[0]);
 
             // Create new current file
             _fileWriter = new StreamWriter(_currentLogFilePath, append: false, Encoding.UTF8)
             {
-                AutoFlush = true
+                AutoFlush = false
             };
+            _currentLogFileBytes = 0;
         }
         catch
         {
@@ -416,6 +453,7 @@ public class LoggingService : IDisposable
         if (_disposed)
             return;
         _disposed = true;
+        _flushTimer.Dispose();
 
         lock (_fileLock)
         {
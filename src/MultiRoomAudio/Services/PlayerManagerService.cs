@@ -21,7 +21,7 @@ namespace MultiRoomAudio.Services;
 /// Handles creation, connection, state management, and disposal.
 /// Integrates with ConfigurationService for persistence and autostart.
 /// </summary>
-public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposable
+public partial class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposable
 {
     private readonly ILogger<PlayerManagerService> _logger;
     private readonly ILoggerFactory _loggerFactory;
@@ -51,6 +51,12 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
     /// </summary>
     private Task? _reconnectionTask;
 
+    /// <summary>
+    /// Wakes the reconnection task when a player is queued, so it can sleep until the next
+    /// retry is due instead of rescanning the queue every second.
+    /// </summary>
+    private readonly SemaphoreSlim _reconnectionSignal = new(0, 1);
+
     /// <summary>
     /// Cached server URI from mDNS discovery to avoid race conditions.
     /// </summary>
@@ -66,6 +72,64 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
     /// </summary>
     private readonly SemaphoreSlim _discoveryLock = new(1, 1);
 
+    /// <summary>
+    /// Last player list pushed to SignalR clients, used to skip identical broadcasts
+    /// and to compute per-player deltas.
+    /// </summary>
+    private List<PlayerResponse>? _lastBroadcastPlayers;
+
+    /// <summary>
+    /// When the last full status snapshot was sent.
+    /// </summary>
+    private DateTime _lastBroadcastAt = DateTime.MinValue;
+
+    /// <summary>
+    /// Sequence number of the last status broadcast, so clients can spot a missed delta.
+    /// </summary>
+    private long _broadcastSequence;
+
+    /// <summary>
+    /// Lock guarding the last-broadcast snapshot.
+    /// </summary>
+    private readonly object _broadcastLock = new();
+
+    /// <summary>
+    /// Set while a status broadcast is waiting to run (1) so bursts of state changes share it.
+    /// </summary>
+    private int _broadcastScheduled;
+
+    /// <summary>
+    /// Lock that makes concurrent <see cref="GetAllPlayers"/> callers share one build.
+    /// </summary>
+    private readonly object _playersListLock = new();
+
+    /// <summary>
+    /// Most recently built player list, reused for <see cref="PlayersListCacheTtl"/>.
+    /// </summary>
+    private PlayersListResponse? _cachedPlayersList;
+
+    /// <summary>
+    /// When <see cref="_cachedPlayersList"/> was built (Environment.TickCount64).
+    /// </summary>
+    private long _cachedPlayersListAtTicks;
+
+    /// <summary>
+    /// Bumped by every runtime player change (see <see cref="InvalidatePlayersList"/>);
+    /// the cached list is only reused while it matches.
+    /// </summary>
+    private long _playersListVersion;
+
+    /// <summary>
+    /// Value of <see cref="_playersListVersion"/> when the cached list was started.
+    /// </summary>
+    private long _cachedPlayersListVersion;
+
+    /// <summary>
+    /// <see cref="ConfigurationService.PlayersVersion"/> when the cached list was started, so
+    /// config-only edits (startup volume, server URL, ...) also invalidate it.
+    /// </summary>
+    private long _cachedPlayersConfigVersion;
+
     #region Constants
 
     /// <summary>
@@ -158,9 +222,8 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
     /// Pattern for valid player names.
     /// Allows alphanumeric characters, spaces, hyphens, underscores, apostrophes, and ampersands.
     /// </summary>
-    private static readonly Regex ValidPlayerNamePattern = new(
-        @"^[a-zA-Z0-9\s\-_'&]+$",
-        RegexOptions.Compiled);
+    [GeneratedRegex(@"^[a-zA-Z0-9\s\-_'&]+$")]
+    private static partial Regex ValidPlayerNamePattern();
 
     /// <summary>
     /// Initial delay before first reconnection attempt.
@@ -183,6 +246,35 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
     /// </summary>
     private static readonly TimeSpan VolumeGracePeriod = TimeSpan.FromSeconds(5);
 
+    /// <summary>
+    /// Maximum number of players set up concurrently during autostart.
+    /// Player creation probes the device via pactl and opens the audio stream,
+    /// so a small pool keeps one slow device from holding up the rest.
+    /// </summary>
+    private const int AutostartConcurrency = 4;
+
+    /// <summary>
+    /// Longest autostart waits for initial connection attempts before checking for failures
+    /// (mDNS discovery timeout plus buffer). The check runs as soon as every attempt settles.
+    /// </summary>
+    private static readonly TimeSpan AutostartConnectionWait = TimeSpan.FromSeconds(8);
+
+    /// <summary>
+    /// Maximum time an unchanged player list is suppressed before it is broadcast anyway.
+    /// </summary>
+    private static readonly TimeSpan StatusBroadcastRefreshInterval = TimeSpan.FromSeconds(30);
+
+    /// <summary>
+    /// Window over which status change notifications are coalesced into a single broadcast.
+    /// </summary>
+    private static readonly TimeSpan StatusBroadcastCoalesceDelay = TimeSpan.FromMilliseconds(100);
+
+    /// <summary>
+    /// How long a built player list is shared between callers (REST, hub connects, health).
+    /// State changes invalidate it immediately, so this only bounds staleness of live metrics.
+    /// </summary>
+    private static readonly TimeSpan PlayersListCacheTtl = TimeSpan.FromMilliseconds(200);
+
     #endregion
 
     #region Helper Methods
@@ -328,6 +420,9 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         public int InitialVolume { get; init; } // Store initial volume to detect resets
         public long SamplesPlayed { get; set; }
 
+        // Initial connection attempt; completes once connected or failed (never faults)
+        public Task? ConnectTask { get; set; }
+
         // Event handler references for proper cleanup (prevents memory leaks)
         public EventHandler<ConnectionStateChangedEventArgs>? ConnectionStateHandler { get; set; }
         public EventHandler<AudioPipelineState>? PipelineStateHandler { get; set; }
@@ -491,10 +586,14 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         _logger.LogInformation("Found {AutostartCount} players configured for autostart",
             autostartPlayers.Count);
 
-        foreach (var playerConfig in autostartPlayers)
+        var parallelOptions = new ParallelOptions
         {
-            await TryAutostartPlayerAsync(playerConfig, cancellationToken);
-        }
+            MaxDegreeOfParallelism = AutostartConcurrency,
+            CancellationToken = cancellationToken
+        };
+
+        await Parallel.ForEachAsync(autostartPlayers, parallelOptions,
+            async (playerConfig, ct) => await TryAutostartPlayerAsync(playerConfig, ct));
 
         // Check for any players that failed to connect after mDNS discovery timeout
         await CheckForFailedConnectionsAsync(autostartPlayers, cancellationToken);
@@ -555,9 +654,21 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         IReadOnlyList<PlayerConfiguration> autostartPlayers,
         CancellationToken cancellationToken)
     {
-        // Wait for all mDNS discovery attempts to complete (6s timeout + 2s buffer)
+        // Wait for the players' connection attempts themselves rather than a fixed delay,
+        // so the check runs as soon as the last one settles (bounded by the mDNS timeout)
         _logger.LogDebug("Waiting for connection attempts to complete...");
-        await Task.Delay(8000, cancellationToken);
+        var connectTasks = autostartPlayers
+            .Select(p => _players.TryGetValue(p.Name, out var ctx) ? ctx.ConnectTask : null)
+            .OfType<Task>()
+            .ToList();
+        try
+        {
+            await Task.WhenAll(connectTasks).WaitAsync(AutostartConnectionWait, cancellationToken);
+        }
+        catch (TimeoutException)
+        {
+            _logger.LogDebug("Some connection attempts still pending after {Timeout}", AutostartConnectionWait);
+        }
 
         foreach (var playerConfig in autostartPlayers)
         {
@@ -597,11 +708,18 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         _pendingReconnections.Clear();
 
         var playerNames = _players.Keys.ToList();
-        foreach (var name in playerNames)
+        if (_logger.IsEnabled(LogLevel.Debug))
         {
-            _logger.LogDebug("Stopping player {PlayerName}...", name);
+            foreach (var name in playerNames)
+            {
+                _logger.LogDebug("Stopping player {PlayerName}...", name);
+            }
         }
 
+        // Signal every player before tearing any down, so their cancellation-driven
+        // shutdown overlaps instead of each one starting behind the previous disconnect
+        CancelPlayerContexts(_players.Values);
+
         // On service shutdown, fully dispose all players
         var tasks = playerNames.Select(name => RemoveAndDisposePlayerAsync(name)).ToArray();
         await Task.WhenAll(tasks);
@@ -634,7 +752,7 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         }
 
         // Validate against allowed character pattern
-        if (!ValidPlayerNamePattern.IsMatch(name))
+        if (!ValidPlayerNamePattern().IsMatch(name))
         {
             errorMessage = "Player name contains invalid characters. Only letters, numbers, spaces, hyphens, underscores, apostrophes, and ampersands are allowed.";
             return false;
@@ -881,9 +999,8 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         }
 
         // Start connection in background with proper error handling
-        FireAndForget(
-            ConnectPlayerWithErrorHandlingAsync(name, context, context.Cts.Token),
-            $"Connection setup for player '{name}'", _logger);
+        context.ConnectTask = ConnectPlayerWithErrorHandlingAsync(name, context, context.Cts.Token);
+        FireAndForget(context.ConnectTask, $"Connection setup for player '{name}'", _logger);
 
         // Broadcast status update to all clients
         FireAndForget(BroadcastStatusAsync(), $"Status broadcast after creating player '{name}'", _logger);
@@ -1004,31 +1121,68 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
 
     /// <summary>
     /// Gets all players, including those that failed to start.
+    /// Concurrent callers are single-flighted: one builds the list while the others wait
+    /// for it, and the result is reused for <see cref="PlayersListCacheTtl"/>.
     /// </summary>
     public PlayersListResponse GetAllPlayers()
     {
-        var responses = new List<PlayerResponse>();
+        lock (_playersListLock)
+        {
+            var version = Interlocked.Read(ref _playersListVersion);
+            var configVersion = _config.PlayersVersion;
+            if (_cachedPlayersList != null &&
+                _cachedPlayersListVersion == version &&
+                _cachedPlayersConfigVersion == configVersion &&
+                Environment.TickCount64 - _cachedPlayersListAtTicks < (long)PlayersListCacheTtl.TotalMilliseconds)
+            {
+                return _cachedPlayersList;
+            }
+
+            // A change racing with the build bumps the version, so this result won't be reused
+            var list = BuildPlayersList();
+            _cachedPlayersList = list;
+            _cachedPlayersListVersion = version;
+            _cachedPlayersConfigVersion = configVersion;
+            _cachedPlayersListAtTicks = Environment.TickCount64;
+            return list;
+        }
+    }
+
+    /// <summary>
+    /// Drops the shared player list so the next caller sees current state.
+    /// Every mutator of runtime player state must call this (directly or via
+    /// <see cref="BroadcastStatusAsync"/>).
+    /// </summary>
+    private void InvalidatePlayersList()
+    {
+        // Lock-free so state changes never wait behind a build in progress
+        Interlocked.Increment(ref _playersListVersion);
+    }
 
-        // Get all configured players from config
-        var configuredPlayers = _config.Players;
+    private PlayersListResponse BuildPlayersList()
+    {
+        // Snapshot config once; it is used both to enumerate players and for startup volumes
+        var configuredPlayers = _config.GetAllPlayerConfigurations();
+        var responses = new List<PlayerResponse>(configuredPlayers.Count);
 
         foreach (var (name, config) in configuredPlayers)
         {
             if (_players.TryGetValue(name, out var context))
             {
                 // Player is active - use live status
-                responses.Add(CreateResponse(name, context));
+                responses.Add(CreateResponse(name, context, config));
             }
             else
             {
                 // Player is configured but not active (failed to start or was stopped)
                 // Check if it's pending reconnection
                 var isPendingReconnection = _pendingReconnections.TryGetValue(name, out var reconnectState);
-                var state = isPendingReconnection && !reconnectState!.WasUserStopped
+                var isReconnecting = isPendingReconnection && !reconnectState!.WasUserStopped;
+                var state = isReconnecting
                     ? PlayerState.Reconnecting
                     : PlayerState.Error;
-                var errorMessage = isPendingReconnection && !reconnectState!.WasUserStopped
-                    ? $"Reconnecting... (attempt {reconnectState.RetryCount})"
+                var errorMessage = isReconnecting
+                    ? $"Reconnecting... (attempt {reconnectState!.RetryCount})"
                     : "Player not running. Device may be unavailable or misconfigured.";
 
                 // Return a placeholder response so user can edit/reconfigure it
@@ -1085,6 +1239,7 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         {
             await context.Pipeline.SwitchDeviceAsync(newDeviceId, ct);
             context.Config.DeviceId = newDeviceId;
+            InvalidatePlayersList();
             return true;
         }
         catch (Exception ex)
@@ -1143,6 +1298,7 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
             return false;
 
         context.Pipeline.SetMuted(muted);
+        InvalidatePlayersList();
         return true;
     }
 
@@ -1213,9 +1369,12 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
             return false;
 
         // Mark as user-stopped to prevent auto-reconnection
-        if (_pendingReconnections.TryGetValue(name, out var reconnectState))
+        // Compare-and-swap so an entry the reconnection task removes (or requeues) in the
+        // meantime isn't resurrected or overwritten with stale retry state
+        while (_pendingReconnections.TryGetValue(name, out var reconnectState) && !reconnectState.WasUserStopped)
         {
-            _pendingReconnections[name] = reconnectState with { WasUserStopped = true };
+            if (_pendingReconnections.TryUpdate(name, reconnectState with { WasUserStopped = true }, reconnectState))
+                break;
         }
 
         // Already stopped?
@@ -1231,6 +1390,8 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         {
             context.Cts.Cancel();
             context.State = PlayerState.Stopped;
+            // The broadcast below only follows the (bounded) pipeline stop and disconnect
+            InvalidatePlayersList();
 
             // Stop pipeline and disconnect, but don't remove from dictionary
             try
@@ -1383,6 +1544,7 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         if (_players.TryGetValue(name, out var context))
         {
             context.Player.Pause();
+            InvalidatePlayersList();
             return true;
         }
         return false;
@@ -1398,6 +1560,7 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         if (_players.TryGetValue(name, out var context))
         {
             context.Player.Play();
+            InvalidatePlayersList();
             return true;
         }
         return false;
@@ -1447,20 +1610,15 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
                 throw new EntityAlreadyExistsException("Player", newName);
             }
 
-            // Get the player context
-            if (!_players.TryGetValue(currentName, out var context))
+            // Atomic rename: remove old and add new within lock; the removal also
+            // hands back the context, so there's no separate lookup first
+            if (!_players.TryRemove(currentName, out var context))
             {
                 return false;
             }
 
             _logger.LogInformation("Renaming player '{OldName}' to '{NewName}'", currentName, newName);
 
-            // Atomic rename: remove old and add new within lock
-            if (!_players.TryRemove(currentName, out _))
-            {
-                return false;
-            }
-
             // Update the config name
             context.Config.Name = newName;
 
@@ -1766,6 +1924,7 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
             _logger.LogError(error.Exception, "Player '{Name}' pipeline error: {Message}",
                 name, error.Message);
             context.ErrorMessage = error.Message;
+            InvalidatePlayersList();
 
             // Auto-stop player on pipeline error to prevent resource waste
             _logger.LogWarning("Auto-stopping player '{Name}' due to pipeline error", name);
@@ -1787,6 +1946,7 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
             _logger.LogError(error.Exception, "Player '{Name}' audio error: {Message}",
                 name, error.Message);
             context.ErrorMessage = error.Message;
+            InvalidatePlayersList();
 
             // Auto-stop player on audio error (e.g., device unavailable)
             _logger.LogWarning("Auto-stopping player '{Name}' due to audio error", name);
@@ -1912,6 +2072,14 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
     }
 
     private PlayerResponse CreateResponse(string name, PlayerContext context)
+    {
+        return CreateResponse(name, context, _config.GetPlayer(name));
+    }
+
+    /// <summary>
+    /// Builds a player response using an already-resolved persisted configuration.
+    /// </summary>
+    private PlayerResponse CreateResponse(string name, PlayerContext context, PlayerConfiguration? persistedConfig)
     {
         var bufferStats = context.Pipeline.BufferStats;
 
@@ -1919,7 +2087,7 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         var isPendingReconnection = _pendingReconnections.TryGetValue(name, out var reconnectState);
 
         // Get startup volume from persisted config (not runtime config which changes with MA)
-        var startupVolume = _config.Players.TryGetValue(name, out var persistedConfig)
+        var startupVolume = persistedConfig != null
             ? persistedConfig.Volume ?? 100
             : context.Config.Volume;
 
@@ -2022,6 +2190,7 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
             // Update state to error first
             context.State = PlayerState.Error;
             context.ErrorMessage = reason;
+            InvalidatePlayersList();
 
             // Stop the pipeline gracefully
             try
@@ -2066,13 +2235,40 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
 
     /// <summary>
     /// Broadcasts the current player status to all connected SignalR clients.
+    /// Calls made while a broadcast is already pending are folded into it, so a burst of
+    /// state changes (start, connect, volume sync) produces one snapshot instead of several.
     /// </summary>
     private async Task BroadcastStatusAsync()
     {
+        // Every state change comes through here, so this is where the shared list goes stale
+        InvalidatePlayersList();
+
+        if (Interlocked.Exchange(ref _broadcastScheduled, 1) == 1)
+            return;
+
+        try
+        {
+            await Task.Delay(StatusBroadcastCoalesceDelay);
+        }
+        finally
+        {
+            // Clear before taking the snapshot so later changes schedule a fresh broadcast
+            Interlocked.Exchange(ref _broadcastScheduled, 0);
+        }
+
+        if (_disposed)
+            return;
+
         try
         {
             var players = GetAllPlayers();
-            await _hubContext.BroadcastStatusUpdateAsync(players);
+            if (!TryPlanBroadcast(players.Players, out var delta, out var sequence))
+                return;
+
+            if (delta != null)
+                await _hubContext.BroadcastStatusDeltaAsync(delta);
+            else
+                await _hubContext.BroadcastStatusUpdateAsync(players, sequence);
         }
         catch (Exception ex)
         {
@@ -2080,6 +2276,67 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         }
     }
 
+    /// <summary>
+    /// Decides what to send for a player list compared with the last one broadcast.
+    /// Returns false when nothing changed (new clients get a full snapshot on connect).
+    /// Otherwise <paramref name="delta"/> holds only the changed and removed players, or is
+    /// null when a full snapshot is due: on the first broadcast, and every
+    /// <see cref="StatusBroadcastRefreshInterval"/> so clients resync.
+    /// </summary>
+    private bool TryPlanBroadcast(List<PlayerResponse> players, out PlayerStatusDelta? delta, out long sequence)
+    {
+        lock (_broadcastLock)
+        {
+            delta = null;
+            sequence = _broadcastSequence;
+            var now = DateTime.UtcNow;
+            var previous = _lastBroadcastPlayers;
+
+            if (previous == null || now - _lastBroadcastAt >= StatusBroadcastRefreshInterval)
+            {
+                _lastBroadcastPlayers = players;
+                _lastBroadcastAt = now;
+                sequence = ++_broadcastSequence;
+                return true;
+            }
+
+            var previousByName = previous.ToDictionary(p => p.Name);
+            var changed = new List<PlayerResponse>();
+            foreach (var player in players)
+            {
+                if (!previousByName.Remove(player.Name, out var old) || old != player)
+                    changed.Add(player);
+            }
+
+            // Anything left in the lookup is no longer in the current list
+            if (changed.Count == 0 && previousByName.Count == 0)
+                return false;
+
+            _lastBroadcastPlayers = players;
+            sequence = ++_broadcastSequence;
+            delta = new PlayerStatusDelta(changed, previousByName.Keys.ToList(), sequence);
+            return true;
+        }
+    }
+
+    /// <summary>
+    /// Full status for a single client (on connect or on request), matching the last
+    /// broadcast so the deltas that follow apply to it cleanly.
+    /// </summary>
+    public PlayerStatusUpdate GetStatusSnapshot()
+    {
+        long sequence;
+        lock (_broadcastLock)
+        {
+            sequence = _broadcastSequence;
+            if (_lastBroadcastPlayers != null)
+                return new PlayerStatusUpdate(_lastBroadcastPlayers, sequence);
+        }
+
+        // Nothing broadcast yet; the first broadcast is always a full snapshot
+        return new PlayerStatusUpdate(GetAllPlayers().Players, sequence);
+    }
+
     #region Reconnection Methods
 
     /// <summary>
@@ -2090,26 +2347,67 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         if (_disposed)
             return;
 
-        var state = _pendingReconnections.GetOrAdd(config.Name, _ => new ReconnectionState(config));
-
         // Calculate next retry time with exponential backoff
-        var delay = CalculateBackoffDelay(state.RetryCount);
-        var nextRetry = DateTime.UtcNow.Add(delay);
-
-        _pendingReconnections[config.Name] = state with
+        // AddOrUpdate applies the change atomically against whatever entry is current, so a
+        // concurrent stop (WasUserStopped) or removal isn't lost to a read-modify-write race
+        static ReconnectionState ScheduleNextAttempt(ReconnectionState current) => current with
         {
-            RetryCount = state.RetryCount + 1,
-            NextRetryTime = nextRetry
+            RetryCount = current.RetryCount + 1,
+            NextRetryTime = DateTime.UtcNow.Add(CalculateBackoffDelay(current.RetryCount))
         };
 
+        var state = _pendingReconnections.AddOrUpdate(
+            config.Name,
+            _ => ScheduleNextAttempt(new ReconnectionState(config)),
+            (_, existing) => ScheduleNextAttempt(existing));
+        var delay = CalculateBackoffDelay(state.RetryCount - 1);
+
         _logger.LogInformation(
             "Player '{Name}' queued for reconnection (attempt {Attempt}, next retry in {Delay:F0}s)",
-            config.Name, state.RetryCount + 1, delay.TotalSeconds);
+            config.Name, state.RetryCount, delay.TotalSeconds);
+
+        SignalReconnectionTask();
 
         // Broadcast status so UI shows reconnection state
         _ = BroadcastStatusAsync();
     }
 
+    /// <summary>
+    /// Wakes the reconnection task so it re-evaluates when the next retry is due.
+    /// </summary>
+    private void SignalReconnectionTask()
+    {
+        try
+        {
+            _reconnectionSignal.Release();
+        }
+        catch (SemaphoreFullException)
+        {
+            // Already signalled - the pending wake will see this change too
+        }
+    }
+
+    /// <summary>
+    /// Sleeps until the earliest queued retry is due, or until a player is newly queued.
+    /// </summary>
+    private async Task WaitForNextReconnectionAsync(CancellationToken ct)
+    {
+        var now = DateTime.UtcNow;
+        DateTime? nextRetry = null;
+        foreach (var state in _pendingReconnections.Values)
+        {
+            if (!state.WasUserStopped && (nextRetry == null || state.NextRetryTime < nextRetry))
+            {
+                nextRetry = state.NextRetryTime;
+            }
+        }
+
+        var delay = nextRetry.HasValue
+            ? (nextRetry.Value > now ? nextRetry.Value - now : TimeSpan.Zero)
+            : Timeout.InfiniteTimeSpan;
+        await _reconnectionSignal.WaitAsync(delay, ct);
+    }
+
     /// <summary>
     /// Removes a player from the reconnection queue.
     /// </summary>
@@ -2143,7 +2441,7 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         {
             try
             {
-                await Task.Delay(TimeSpan.FromSeconds(1), ct);
+                await WaitForNextReconnectionAsync(ct);
 
                 var now = DateTime.UtcNow;
                 var playersToReconnect = _pendingReconnections
@@ -2276,21 +2574,12 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         }
 
         // Dispose outside lock to avoid potential deadlocks
-        foreach (var context in contextsToDispose)
+        // Use Task.Run to avoid sync context deadlocks when calling async dispose methods
+        // Note: .Wait() is used here because Dispose() must be synchronous per IDisposable contract
+        // All players share one DisposalTimeout rather than each getting its own
+        if (!Task.Run(() => DisposePlayerContextsAsync(contextsToDispose)).Wait(DisposalTimeout))
         {
-            // Unsubscribe event handlers first to prevent memory leaks and disposal crashes
-            UnwireEvents(context);
-            context.Cts.Cancel();
-            try
-            {
-                // Use Task.Run to avoid sync context deadlocks when calling async dispose methods
-                // Note: .Wait() is used here because Dispose() must be synchronous per IDisposable contract
-                Task.Run(() => DisposePlayerContextAsync(context)).Wait(DisposalTimeout);
-            }
-            catch (Exception ex)
-            {
-                _logger.LogWarning(ex, "Error disposing player context");
-            }
+            _logger.LogWarning("Player disposal did not finish within {Timeout}", DisposalTimeout);
         }
 
         _logger.LogInformation("PlayerManagerService disposed");
@@ -2320,11 +2609,21 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
         }
 
         // Dispose outside lock to avoid potential deadlocks
-        foreach (var context in contextsToDispose)
+        await DisposePlayerContextsAsync(contextsToDispose);
+
+        _logger.LogInformation("PlayerManagerService disposed asynchronously");
+    }
+
+    /// <summary>
+    /// Disposes player contexts concurrently, so total shutdown time is bounded by the
+    /// slowest player rather than the sum of all of them.
+    /// </summary>
+    private async Task DisposePlayerContextsAsync(IReadOnlyList<PlayerContext> contexts)
+    {
+        CancelPlayerContexts(contexts);
+
+        await Task.WhenAll(contexts.Select(async context =>
         {
-            // Unsubscribe event handlers first to prevent memory leaks and disposal crashes
-            UnwireEvents(context);
-            context.Cts.Cancel();
             try
             {
                 await DisposePlayerContextAsync(context);
@@ -2333,9 +2632,21 @@ public class PlayerManagerService : IHostedService, IAsyncDisposable, IDisposabl
             {
                 _logger.LogWarning(ex, "Error disposing player context");
             }
-        }
+        }));
+    }
 
-        _logger.LogInformation("PlayerManagerService disposed asynchronously");
+    /// <summary>
+    /// Unwires and cancels each context in one pass, ahead of any per-player teardown.
+    /// Both steps are idempotent, so the usual dispose path can repeat them.
+    /// </summary>
+    private void CancelPlayerContexts(IEnumerable<PlayerContext> contexts)
+    {
+        foreach (var context in contexts)
+        {
+            // Unsubscribe event handlers first to prevent memory leaks and disposal crashes
+            UnwireEvents(context);
+            context.Cts.Cancel();
+        }
     }
 
     #endregion
@@ -1,4 +1,5 @@
 using System.Diagnostics;
+using MultiRoomAudio.Audio.PulseAudio;
 
 namespace MultiRoomAudio.Services;
 
@@ -77,8 +78,12 @@ public class StartupDiagnosticsService
             // Run pactl info for diagnostics
             RunPactlInfo();
 
-            // Also list available sinks
-            RunPactlListSinks();
+            // The sink listing is only informational (players enumerate sinks themselves
+            // during startup), so skip the extra pactl spawn unless debug logging is on
+            if (_logger.IsEnabled(LogLevel.Debug))
+            {
+                RunPactlListSinks();
+            }
         }
         catch (Exception ex)
         {
@@ -90,7 +95,7 @@ public class StartupDiagnosticsService
     {
         var psi = new ProcessStartInfo
         {
-            FileName = "pactl",
+            FileName = PactlCommandRunner.PactlPath,
             Arguments = "info",
             RedirectStandardOutput = true,
             RedirectStandardError = true,
@@ -105,20 +110,30 @@ public class StartupDiagnosticsService
             return;
         }
 
-        var output = process.StandardOutput.ReadToEnd();
-        var error = process.StandardError.ReadToEnd();
-        process.WaitForExit(5000);
+        // Drain both pipes concurrently so neither can fill up and stall pactl
+        var outputTask = process.StandardOutput.ReadToEndAsync();
+        var errorTask = process.StandardError.ReadToEndAsync();
+        if (!PactlCommandRunner.WaitForExitOrKill(process, 5000))
+        {
+            _logger.LogWarning("pactl info did not respond within 5s. Is PulseAudio available?");
+            return;
+        }
+        var output = outputTask.GetAwaiter().GetResult();
+        var error = errorTask.GetAwaiter().GetResult();
 
         if (process.ExitCode == 0)
         {
             _logger.LogInformation("PulseAudio connected successfully");
             // Log key info lines
-            foreach (var line in output.Split('\n').Where(l =>
-                l.StartsWith("Server Name:") ||
-                l.StartsWith("Default Sink:") ||
-                l.StartsWith("Default Source:")))
+            // Walk the output in place; only the few matching lines are materialized as strings
+            foreach (var line in output.AsSpan().EnumerateLines())
             {
-                _logger.LogInformation("  {Line}", line.Trim());
+                if (line.StartsWith("Server Name:") ||
+                    line.StartsWith("Default Sink:") ||
+                    line.StartsWith("Default Source:"))
+                {
+                    _logger.LogInformation("  {Line}", line.Trim().ToString());
+                }
             }
         }
         else
@@ -131,7 +146,7 @@ public class StartupDiagnosticsService
     {
         var psi = new ProcessStartInfo
         {
-            FileName = "pactl",
+            FileName = PactlCommandRunner.PactlPath,
             Arguments = "list sinks short",
             RedirectStandardOutput = true,
             RedirectStandardError = true,
@@ -146,15 +161,27 @@ public class StartupDiagnosticsService
             return;
         }
 
-        var sinkOutput = sinkProcess.StandardOutput.ReadToEnd();
-        sinkProcess.WaitForExit(5000);
+        // Drain both pipes in the background so the exit wait below can time out a hung pactl
+        var sinkOutputTask = sinkProcess.StandardOutput.ReadToEndAsync();
+        var sinkErrorTask = sinkProcess.StandardError.ReadToEndAsync();
+        if (!PactlCommandRunner.WaitForExitOrKill(sinkProcess, 5000))
+        {
+            _logger.LogWarning("pactl list sinks did not exit within 5s");
+            return;
+        }
+        var sinkOutput = sinkOutputTask.GetAwaiter().GetResult();
+        sinkErrorTask.GetAwaiter().GetResult();
 
         if (sinkProcess.ExitCode == 0 && !string.IsNullOrWhiteSpace(sinkOutput))
         {
-            _logger.LogInformation("PulseAudio sinks available:");
-            foreach (var line in sinkOutput.Split('\n').Where(l => !string.IsNullOrWhiteSpace(l)))
+            _logger.LogDebug("PulseAudio sinks available:");
+            foreach (var line in sinkOutput.AsSpan().EnumerateLines())
             {
-                _logger.LogInformation("  {Sink}", line.Trim());
+                var sink = line.Trim();
+                if (!sink.IsEmpty)
+                {
+                    _logger.LogDebug("  {Sink}", sink.ToString());
+                }
             }
         }
     }
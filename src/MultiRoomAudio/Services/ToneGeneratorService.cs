@@ -1,5 +1,6 @@
 using System.Diagnostics;
 using MultiRoomAudio.Exceptions;
+using MultiRoomAudio.Utilities;
 
 namespace MultiRoomAudio.Services;
 
@@ -19,6 +20,12 @@ public class ToneGeneratorService
     private const int SampleRate = 44100;
     private const int Channels = 2;
     private const int BitsPerSample = 16;
+    private const int PaplayTimeoutMs = 10000;  // Longest a single test tone may play
+    private const int PaplayKillWaitMs = 2000;  // How long to wait for paplay to exit once killed
+    private const int PaplayErrorTailChars = 4096;  // Most stderr kept for a failure message
+
+    // Resolved lazily and only cached once found, so a paplay installed after startup is picked up
+    private static string? _paplayPath;
 
     // Track active playback to prevent overlapping tones
     private readonly SemaphoreSlim _playbackLock = new(1, 1);
@@ -371,8 +378,8 @@ public class ToneGeneratorService
     {
         var psi = new ProcessStartInfo
         {
-            FileName = "paplay",
-            RedirectStandardOutput = true,
+            FileName = ResolvePaplayPath() ?? "paplay",
+            // Only stderr is read (on failure); paplay is silent on stdout, so no pipe for it
             RedirectStandardError = true,
             UseShellExecute = false,
             CreateNoWindow = true
@@ -386,65 +393,146 @@ public class ToneGeneratorService
         }
         psi.ArgumentList.Add(wavFile);
 
-        _logger.LogDebug("Running: paplay --device={Sink}{NoRemix}{ChannelMap} {File}",
-            sinkName,
-            !string.IsNullOrEmpty(channelMap) ? " --no-remix" : "",
-            !string.IsNullOrEmpty(channelMap) ? $" --channel-map={channelMap}" : "",
-            wavFile);
+        if (_logger.IsEnabled(LogLevel.Debug))
+        {
+            _logger.LogDebug("Running: paplay --device={Sink}{NoRemix}{ChannelMap} {File}",
+                sinkName,
+                !string.IsNullOrEmpty(channelMap) ? " --no-remix" : "",
+                !string.IsNullOrEmpty(channelMap) ? $" --channel-map={channelMap}" : "",
+                wavFile);
+        }
 
         using var process = new Process { StartInfo = psi };
         process.Start();
 
+        // Drain stderr while paplay runs so a chatty failure can't fill the pipe,
+        // keeping only the tail for the error message
+        var stderrTail = ReadTailAsync(process.StandardError, PaplayErrorTailChars);
+
         // Wait for completion with timeout
-        var timeoutMs = 10000;  // 10 second timeout
-        using var timeoutCts = new CancellationTokenSource(timeoutMs);
+        using var timeoutCts = new CancellationTokenSource(PaplayTimeoutMs);
         using var linkedCts = CancellationTokenSource.CreateLinkedTokenSource(ct, timeoutCts.Token);
 
         try
         {
             await process.WaitForExitAsync(linkedCts.Token);
         }
-        catch (OperationCanceledException) when (timeoutCts.IsCancellationRequested)
+        catch (OperationCanceledException)
         {
-            _logger.LogWarning("paplay timed out after {Timeout}ms, killing process", timeoutMs);
-            process.Kill();
-            throw new TimeoutException($"Test tone playback timed out after {timeoutMs}ms");
+            // Timed out or the caller gave up - either way don't leave paplay playing
+            var timedOut = timeoutCts.IsCancellationRequested && !ct.IsCancellationRequested;
+            if (timedOut)
+            {
+                _logger.LogWarning("paplay timed out after {Timeout}ms, killing process", PaplayTimeoutMs);
+            }
+
+            await StopPaplayAsync(process);
+            await ObserveStderrTailAsync(stderrTail);
+
+            if (timedOut)
+            {
+                throw new TimeoutException($"Test tone playback timed out after {PaplayTimeoutMs}ms");
+            }
+            throw;
         }
 
         if (process.ExitCode != 0)
         {
-            var error = await process.StandardError.ReadToEndAsync(ct);
+            var error = await stderrTail;
             _logger.LogWarning("paplay exited with code {ExitCode}: {Error}", process.ExitCode, error);
             throw new InvalidOperationException($"paplay failed: {error}");
         }
     }
 
     /// <summary>
-    /// Check if paplay is available on the system.
+    /// Reads a stream to the end, keeping only its last <paramref name="maxChars"/> characters.
     /// </summary>
-    public async Task<bool> IsPaplayAvailableAsync()
+    /// <summary>
+    /// Settle the stderr reader of a killed paplay before the process (and its pipe) is disposed.
+    /// </summary>
+    private async Task ObserveStderrTailAsync(Task<string> stderrTail)
     {
         try
         {
-            var psi = new ProcessStartInfo
+            // The pipe closes once paplay is gone; don't hang if it somehow outlived the kill
+            await stderrTail.WaitAsync(TimeSpan.FromMilliseconds(PaplayKillWaitMs));
+        }
+        catch (TimeoutException)
+        {
+            // Disposing the process will fault the read; keep that from going unobserved
+            _ = stderrTail.ContinueWith(static t => _ = t.Exception, TaskContinuationOptions.OnlyOnFaulted);
+        }
+        catch (Exception ex)
+        {
+            _logger.LogDebug(ex, "Reading paplay stderr failed after it was stopped");
+        }
+    }
+
+    private static async Task<string> ReadTailAsync(StreamReader reader, int maxChars)
+    {
+        var buffer = new char[maxChars * 2];
+        var length = 0;
+        int read;
+        while ((read = await reader.ReadAsync(buffer.AsMemory(length))) > 0)
+        {
+            length += read;
+            if (length > maxChars)
             {
-                FileName = "which",
-                Arguments = "paplay",
-                RedirectStandardOutput = true,
-                UseShellExecute = false,
-                CreateNoWindow = true
-            };
-
-            using var process = Process.Start(psi);
-            if (process == null)
-                return false;
-
-            await process.WaitForExitAsync();
-            return process.ExitCode == 0;
+                // Slide the most recent output to the front
+                Array.Copy(buffer, length - maxChars, buffer, 0, maxChars);
+                length = maxChars;
+            }
         }
-        catch
+
+        return new string(buffer, 0, length);
+    }
+
+    /// <summary>
+    /// Kills paplay and waits for it to be reaped.
+    /// </summary>
+    /// <remarks>
+    /// WaitForExitAsync completes from the runtime's child-exit notification rather than
+    /// polling, so this returns as soon as paplay is gone; the timeout only bounds a stuck kill.
+    /// </remarks>
+    private async Task StopPaplayAsync(Process process)
+    {
+        try
+        {
+            // paplay never forks, so signal it directly; entireProcessTree would walk /proc
+            // for every process on the system just to find descendants that don't exist
+            process.Kill();
+        }
+        catch (InvalidOperationException)
+        {
+            // Exited between the cancellation and the kill
+            return;
+        }
+
+        using var killCts = new CancellationTokenSource(PaplayKillWaitMs);
+        try
+        {
+            await process.WaitForExitAsync(killCts.Token);
+        }
+        catch (OperationCanceledException)
         {
-            return false;
+            _logger.LogWarning("paplay did not exit within {Timeout}ms of being killed", PaplayKillWaitMs);
         }
     }
+
+    /// <summary>
+    /// Check if paplay is available on the system.
+    /// </summary>
+    /// <remarks>
+    /// Searches PATH directly rather than spawning <c>which</c> (and a pipe for output
+    /// nobody reads).
+    /// </remarks>
+    public Task<bool> IsPaplayAvailableAsync()
+    {
+        return Task.FromResult(ResolvePaplayPath() != null);
+    }
+
+    private static string? ResolvePaplayPath()
+    {
+        return _paplayPath ??= ExecutableLocator.Find("paplay");
+    }
 }
@@ -1,4 +1,5 @@
 using System.Collections.Concurrent;
+using System.Diagnostics.CodeAnalysis;
 using System.Timers;
 using MultiRoomAudio.Models;
 using MultiRoomAudio.Relay;
@@ -26,10 +27,8 @@ public class TriggerService : IHostedService, IAsyncDisposable
     private readonly object _configLock = new();
     private readonly object _stateLock = new();
 
-    // Multi-board support: Dictionary of board ID -> relay board instance
-    private readonly Dictionary<string, IRelayBoard> _relayBoards = new();
-    private readonly Dictionary<string, TriggerFeatureState> _boardStates = new();
-    private readonly Dictionary<string, string?> _boardErrors = new();
+    // Multi-board support: Dictionary of board ID -> relay board instance and status
+    private readonly Dictionary<string, TriggerBoardState> _boards = new();
 
     private TriggerFeatureConfiguration _config = new();
     private bool _disposed;
@@ -37,6 +36,17 @@ public class TriggerService : IHostedService, IAsyncDisposable
     // Track active triggers and their off timers using composite key (boardId, channel)
     private readonly ConcurrentDictionary<(string BoardId, int Channel), TriggerChannelState> _channelStates = new();
 
+    /// <summary>
+    /// Internal state for a relay board. Board is set only while connected; state and
+    /// error are kept for boards that failed to connect, so status needs one lookup.
+    /// </summary>
+    private class TriggerBoardState
+    {
+        public IRelayBoard? Board { get; set; }
+        public TriggerFeatureState State { get; set; }
+        public string? ErrorMessage { get; set; }
+    }
+
     /// <summary>
     /// Internal state for a trigger channel.
     /// </summary>
@@ -114,15 +124,13 @@ public class TriggerService : IHostedService, IAsyncDisposable
         // Apply shutdown behavior for each board and dispose
         foreach (var boardConfig in _config.Boards)
         {
-            if (_relayBoards.TryGetValue(boardConfig.BoardId, out var board))
+            if (TryGetRelayBoard(boardConfig.BoardId, out var board))
             {
                 ApplyShutdownBehavior(board, boardConfig);
                 board.Dispose();
             }
         }
-        _relayBoards.Clear();
-        _boardStates.Clear();
-        _boardErrors.Clear();
+        _boards.Clear();
 
         _logger.LogInformation("TriggerService stopped");
         return Task.CompletedTask;
@@ -166,9 +174,10 @@ public class TriggerService : IHostedService, IAsyncDisposable
         if (boardConfig == null)
             return null;
 
-        _relayBoards.TryGetValue(boardId, out var relayBoard);
-        _boardStates.TryGetValue(boardId, out var state);
-        _boardErrors.TryGetValue(boardId, out var errorMessage);
+        _boards.TryGetValue(boardId, out var boardState);
+        var relayBoard = boardState?.Board;
+        var state = boardState?.State ?? default;
+        var errorMessage = boardState?.ErrorMessage;
 
         var isConnected = relayBoard?.IsConnected ?? false;
         var isPortBased = boardId.StartsWith("USB:");
@@ -249,14 +258,12 @@ public class TriggerService : IHostedService, IAsyncDisposable
             else
             {
                 // Disable: turn off all relays and disconnect all boards
-                foreach (var board in _relayBoards.Values)
+                foreach (var entry in _boards.Values)
                 {
-                    board.AllOff();
-                    board.Dispose();
+                    entry.Board?.AllOff();
+                    entry.Board?.Dispose();
                 }
-                _relayBoards.Clear();
-                _boardStates.Clear();
-                _boardErrors.Clear();
+                _boards.Clear();
 
                 SaveConfiguration();
                 _logger.LogInformation("Trigger feature disabled");
@@ -346,19 +353,16 @@ public class TriggerService : IHostedService, IAsyncDisposable
             }
 
             // Disconnect and turn off relays
-            if (_relayBoards.TryGetValue(boardId, out var board))
+            if (_boards.Remove(boardId, out var boardState) && boardState.Board is { } board)
             {
                 board.AllOff();
                 board.Dispose();
-                _relayBoards.Remove(boardId);
             }
-            _boardStates.Remove(boardId);
-            _boardErrors.Remove(boardId);
 
             // Cancel all timers for this board
             for (int ch = 1; ch <= 16; ch++)
             {
-                CancelOffTimer(boardId, ch);
+                DisposeOffTimer(boardId, ch);
                 _channelStates.TryRemove((boardId, ch), out _);
             }
 
@@ -399,7 +403,7 @@ public class TriggerService : IHostedService, IAsyncDisposable
                 boardConfig.ChannelCount = newCount;
 
                 // If reducing channels, turn off relays beyond new count
-                if (newCount < oldCount && _relayBoards.TryGetValue(boardId, out var board))
+                if (newCount < oldCount && TryGetRelayBoard(boardId, out var board))
                 {
                     for (int ch = newCount + 1; ch <= oldCount; ch++)
                     {
@@ -494,7 +498,7 @@ public class TriggerService : IHostedService, IAsyncDisposable
             if (string.IsNullOrEmpty(customSinkName))
             {
                 CancelOffTimer(boardId, channel);
-                if (_relayBoards.TryGetValue(boardId, out var board))
+                if (TryGetRelayBoard(boardId, out var board))
                 {
                     board.SetRelay(channel, false);
                 }
@@ -525,7 +529,7 @@ public class TriggerService : IHostedService, IAsyncDisposable
         if (channel < 1 || channel > boardConfig.ChannelCount)
             throw new ArgumentOutOfRangeException(nameof(channel), $"Channel must be between 1 and {boardConfig.ChannelCount}");
 
-        if (!_relayBoards.TryGetValue(boardId, out var board) || !board.IsConnected)
+        if (!TryGetRelayBoard(boardId, out var board) || !board.IsConnected)
         {
             _logger.LogWarning("Cannot control relay - board '{BoardId}' not connected", boardId);
             return false;
@@ -567,7 +571,7 @@ public class TriggerService : IHostedService, IAsyncDisposable
         var devices = _deviceEnumerator.GetAllDevices();
 
         // Update IsInUse flag based on which boards are currently connected
-        return devices.Select(d => d with { IsInUse = _relayBoards.ContainsKey(d.BoardId) }).ToList();
+        return devices.Select(d => d with { IsInUse = TryGetRelayBoard(d.BoardId, out _) }).ToList();
     }
 
     #endregion
@@ -589,7 +593,7 @@ public class TriggerService : IHostedService, IAsyncDisposable
                 !string.IsNullOrEmpty(t.CustomSinkName) &&
                 string.Equals(t.CustomSinkName, deviceId, StringComparison.OrdinalIgnoreCase));
 
-            if (trigger != null && _relayBoards.ContainsKey(boardConfig.BoardId))
+            if (trigger != null && TryGetRelayBoard(boardConfig.BoardId, out _))
             {
                 ActivateTrigger(boardConfig.BoardId, trigger.Channel, playerName);
                 return;
@@ -611,7 +615,7 @@ public class TriggerService : IHostedService, IAsyncDisposable
                 !string.IsNullOrEmpty(t.CustomSinkName) &&
                 string.Equals(t.CustomSinkName, deviceId, StringComparison.OrdinalIgnoreCase));
 
-            if (trigger != null && _relayBoards.ContainsKey(boardConfig.BoardId))
+            if (trigger != null && TryGetRelayBoard(boardConfig.BoardId, out _))
             {
                 DeactivateTrigger(boardConfig.BoardId, trigger.Channel, trigger.OffDelaySeconds, playerName);
                 return;
@@ -643,7 +647,7 @@ public class TriggerService : IHostedService, IAsyncDisposable
 
                     // Turn off relay and cancel timer
                     CancelOffTimer(boardConfig.BoardId, trigger.Channel);
-                    if (_relayBoards.TryGetValue(boardConfig.BoardId, out var board))
+                    if (TryGetRelayBoard(boardConfig.BoardId, out var board))
                     {
                         board.SetRelay(trigger.Channel, false);
                     }
@@ -673,11 +677,11 @@ public class TriggerService : IHostedService, IAsyncDisposable
         {
             // Save existing state before disposing (for reconnect scenarios)
             int? previousState = null;
-            if (_relayBoards.TryGetValue(boardId, out var existingBoard))
+            if (_boards.TryGetValue(boardId, out var boardState) && boardState.Board is { } existingBoard)
             {
                 previousState = existingBoard.CurrentState;
                 existingBoard.Dispose();
-                _relayBoards.Remove(boardId);
+                boardState.Board = null;
             }
 
             var boardConfig = _config.Boards.FirstOrDefault(b => b.BoardId == boardId);
@@ -687,6 +691,12 @@ public class TriggerService : IHostedService, IAsyncDisposable
                 return false;
             }
 
+            if (boardState == null)
+            {
+                boardState = new TriggerBoardState();
+                _boards[boardId] = boardState;
+            }
+
             // Initialize channel states for this board
             for (int i = 1; i <= 16; i++)
             {
@@ -708,8 +718,8 @@ public class TriggerService : IHostedService, IAsyncDisposable
             // Check if the factory can create this board type
             if (!_boardFactory.CanCreate(boardId, boardType))
             {
-                _boardStates[boardId] = TriggerFeatureState.Error;
-                _boardErrors[boardId] = $"Cannot create {boardType} board - required library not available.";
+                boardState.State = TriggerFeatureState.Error;
+                boardState.ErrorMessage = $"Cannot create {boardType} board - required library not available.";
                 _logger.LogWarning("Cannot create {BoardType} board '{BoardId}' - library not available", boardType, boardId);
                 return false;
             }
@@ -734,9 +744,9 @@ public class TriggerService : IHostedService, IAsyncDisposable
 
             if (connected)
             {
-                _relayBoards[boardId] = board;
-                _boardStates[boardId] = TriggerFeatureState.Connected;
-                _boardErrors[boardId] = null;
+                boardState.Board = board;
+                boardState.State = TriggerFeatureState.Connected;
+                boardState.ErrorMessage = null;
 
                 // Update board type if it was Unknown
                 if (boardConfig.BoardType == RelayBoardType.Unknown)
@@ -775,8 +785,8 @@ public class TriggerService : IHostedService, IAsyncDisposable
             }
             else
             {
-                _boardStates[boardId] = TriggerFeatureState.Disconnected;
-                _boardErrors[boardId] = $"Failed to connect to {boardType} relay board. Check USB connection.";
+                boardState.State = TriggerFeatureState.Disconnected;
+                boardState.ErrorMessage = $"Failed to connect to {boardType} relay board. Check USB connection.";
                 board.Dispose();
                 _logger.LogWarning("Failed to connect to {BoardType} relay board '{BoardId}'", boardType, boardId);
                 return false;
@@ -886,7 +896,7 @@ public class TriggerService : IHostedService, IAsyncDisposable
             if (!state.IsActive)
             {
                 state.IsActive = true;
-                if (_relayBoards.TryGetValue(boardId, out var board))
+                if (TryGetRelayBoard(boardId, out var board))
                 {
                     board.SetRelay(channel, true);
                 }
@@ -920,7 +930,7 @@ public class TriggerService : IHostedService, IAsyncDisposable
                 {
                     // Immediate off
                     state.IsActive = false;
-                    if (_relayBoards.TryGetValue(boardId, out var board))
+                    if (TryGetRelayBoard(boardId, out var board))
                     {
                         board.SetRelay(channel, false);
                     }
@@ -937,21 +947,47 @@ public class TriggerService : IHostedService, IAsyncDisposable
         }
     }
 
+    /// <summary>
+    /// Gets the connected relay board for an ID, if any.
+    /// </summary>
+    private bool TryGetRelayBoard(string boardId, [NotNullWhen(true)] out IRelayBoard? board)
+    {
+        board = _boards.TryGetValue(boardId, out var boardState) ? boardState.Board : null;
+        return board != null;
+    }
+
     private void StartOffTimer(string boardId, int channel, int delaySeconds)
     {
         if (!_channelStates.TryGetValue((boardId, channel), out var state))
             return;
 
-        CancelOffTimer(boardId, channel);
+        // Each channel keeps one timer for its lifetime and re-arms it, rather than
+        // allocating and disposing a timer on every player stop/start
+        var timer = state.OffDelayTimer;
+        if (timer == null)
+        {
+            timer = new Timer { AutoReset = false };
+            timer.Elapsed += (_, _) => OnOffTimerElapsed(boardId, channel);
+            state.OffDelayTimer = timer;
+        }
+        else
+        {
+            timer.Stop();
+        }
 
-        var timer = new Timer(delaySeconds * 1000);
-        timer.AutoReset = false;
-        timer.Elapsed += (_, _) => OnOffTimerElapsed(boardId, channel);
-        state.OffDelayTimer = timer;
+        timer.Interval = delaySeconds * 1000;
         timer.Start();
     }
 
     private void CancelOffTimer(string boardId, int channel)
+    {
+        if (_channelStates.TryGetValue((boardId, channel), out var state))
+        {
+            state.OffDelayTimer?.Stop();
+        }
+    }
+
+    private void DisposeOffTimer(string boardId, int channel)
     {
         if (_channelStates.TryGetValue((boardId, channel), out var state) && state.OffDelayTimer != null)
         {
@@ -972,8 +1008,7 @@ public class TriggerService : IHostedService, IAsyncDisposable
             if (state.ActivePlayerCount == 0 && state.IsActive)
             {
                 state.IsActive = false;
-                state.OffDelayTimer = null;
-                if (_relayBoards.TryGetValue(boardId, out var board))
+                if (TryGetRelayBoard(boardId, out var board))
                 {
                     board.SetRelay(channel, false);
                 }
@@ -1,5 +1,5 @@
+using MultiRoomAudio.Utilities;
 using YamlDotNet.Serialization;
-using YamlDotNet.Serialization.NamingConventions;
 
 namespace MultiRoomAudio.Services;
 
@@ -28,15 +28,8 @@ public abstract class YamlFileService<T> where T : class, new()
         _filePath = filePath;
         _logger = logger;
 
-        _deserializer = new DeserializerBuilder()
-            .WithNamingConvention(UnderscoredNamingConvention.Instance)
-            .IgnoreUnmatchedProperties()
-            .Build();
-
-        _serializer = new SerializerBuilder()
-            .WithNamingConvention(UnderscoredNamingConvention.Instance)
-            .ConfigureDefaultValuesHandling(DefaultValuesHandling.OmitNull)
-            .Build();
+        _deserializer = YamlSerialization.Deserializer;
+        _serializer = YamlSerialization.Serializer;
     }
 
     /// <summary>
@@ -172,7 +165,7 @@ public abstract class YamlFileService<T> where T : class, new()
                 Directory.CreateDirectory(dir);
             }
 
-            File.WriteAllText(_filePath, yaml);
+            AtomicFile.WriteAllText(_filePath, yaml);
             _logger.LogDebug("Saved data to {Path}", _filePath);
             return true;
         }
@@ -225,15 +218,8 @@ public abstract class YamlDictionaryService<TKey, TValue>
         _filePath = filePath;
         _logger = logger;
 
-        _deserializer = new DeserializerBuilder()
-            .WithNamingConvention(UnderscoredNamingConvention.Instance)
-            .IgnoreUnmatchedProperties()
-            .Build();
-
-        _serializer = new SerializerBuilder()
-            .WithNamingConvention(UnderscoredNamingConvention.Instance)
-            .ConfigureDefaultValuesHandling(DefaultValuesHandling.OmitNull)
-            .Build();
+        _deserializer = YamlSerialization.Deserializer;
+        _serializer = YamlSerialization.Serializer;
     }
 
     /// <summary>
@@ -392,7 +378,7 @@ public abstract class YamlDictionaryService<TKey, TValue>
                 Directory.CreateDirectory(dir);
             }
 
-            File.WriteAllText(_filePath, yaml);
+            AtomicFile.WriteAllText(_filePath, yaml);
             _logger.LogDebug("Saved {Count} items to {Path}", count, _filePath);
             return true;
         }
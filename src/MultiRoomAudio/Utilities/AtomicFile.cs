@@ -0,0 +1,51 @@
+using System.Text;
+
+namespace MultiRoomAudio.Utilities;
+
+/// <summary>
+/// Writes files by staging content in a sibling temp file and renaming it over the target.
+/// </summary>
+/// <remarks>
+/// Readers (including this process after a restart) see either the old file or the new
+/// one, never a truncated rewrite. The temp file lives in the same directory so the
+/// rename stays on one filesystem and is atomic. Each call stages to its own temp name,
+/// so overlapping writers never open or clean up each other's staging file.
+/// </remarks>
+public static class AtomicFile
+{
+    private const string TempSuffix = ".tmp";
+
+    /// <summary>
+    /// Atomically replace <paramref name="path"/> with <paramref name="contents"/> (UTF-8).
+    /// </summary>
+    public static void WriteAllText(string path, string contents)
+    {
+        var tempPath = $"{path}.{Guid.NewGuid():N}{TempSuffix}";
+
+        try
+        {
+            using (var stream = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None))
+            using (var writer = new StreamWriter(stream, new UTF8Encoding(encoderShouldEmitUTF8Identifier: false)))
+            {
+                writer.Write(contents);
+                writer.Flush();
+                stream.Flush(flushToDisk: true);
+            }
+
+            File.Move(tempPath, path, overwrite: true);
+        }
+        catch
+        {
+            try
+            {
+                File.Delete(tempPath);
+            }
+            catch
+            {
+                // Best effort - a stale temp file is harmless next to the real one
+            }
+
+            throw;
+        }
+    }
+}
@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Security.Cryptography;
 using System.Text;
 using System.Text.RegularExpressions;
@@ -21,6 +22,10 @@ public static class ClientIdGenerator
     private const int NameMaxLength = 20;
     private const int HashSuffixLength = 8;
 
+    // IDs depend only on the player name, so each one is derived once and reused
+    // for every subsequent start and status listing of that player.
+    private static readonly ConcurrentDictionary<string, string> ClientIdCache = new(StringComparer.Ordinal);
+
     /// <summary>
     /// Generate a unique client ID from player name.
     /// Creates a deterministic ID based on the player name, prefixed with 'sendspin-'.
@@ -32,6 +37,11 @@ public static class ClientIdGenerator
         if (string.IsNullOrWhiteSpace(playerName))
             throw new ArgumentException("Player name cannot be empty", nameof(playerName));
 
+        return ClientIdCache.GetOrAdd(playerName, BuildClientId);
+    }
+
+    private static string BuildClientId(string playerName)
+    {
         // Create a short hash suffix for uniqueness
         var hashSuffix = ComputeMd5Prefix(playerName, HashSuffixLength);
 
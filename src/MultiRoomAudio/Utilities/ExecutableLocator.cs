@@ -0,0 +1,52 @@
+namespace MultiRoomAudio.Utilities;
+
+/// <summary>
+/// Looks up executables on PATH without spawning <c>which</c>.
+/// </summary>
+public static class ExecutableLocator
+{
+    private const UnixFileMode AnyExecute =
+        UnixFileMode.UserExecute | UnixFileMode.GroupExecute | UnixFileMode.OtherExecute;
+
+    /// <summary>
+    /// Returns the full path of the first executable file named <paramref name="name"/>
+    /// on PATH, or null when there isn't one.
+    /// </summary>
+    /// <remarks>
+    /// Relative PATH entries resolve against the current directory, as the shell does.
+    /// On Unix a file only counts when one of its execute bits is set.
+    /// </remarks>
+    public static string? Find(string name)
+    {
+        var path = Environment.GetEnvironmentVariable("PATH");
+        if (string.IsNullOrEmpty(path))
+            return null;
+
+        foreach (var dir in path.Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries))
+        {
+            try
+            {
+                var candidate = Path.GetFullPath(Path.Combine(dir, name));
+                if (IsExecutableFile(candidate))
+                    return candidate;
+            }
+            catch (Exception ex) when (ex is ArgumentException or IOException or UnauthorizedAccessException)
+            {
+                // Malformed or unreadable PATH entry; keep looking
+            }
+        }
+
+        return null;
+    }
+
+    private static bool IsExecutableFile(string candidate)
+    {
+        if (!File.Exists(candidate))
+            return false;
+
+        if (OperatingSystem.IsWindows())
+            return true;
+
+        return (File.GetUnixFileMode(candidate) & AnyExecute) != 0;
+    }
+}
@@ -1,5 +1,7 @@
+using System.Buffers;
 using System.Diagnostics;
 using System.Text.RegularExpressions;
+using MultiRoomAudio.Audio.PulseAudio;
 
 namespace MultiRoomAudio.Utilities;
 
@@ -18,11 +20,24 @@ public partial class PaModuleRunner : IPaModuleRunner
     [GeneratedRegex(@"^[a-zA-Z0-9_\-\.]+$", RegexOptions.Compiled)]
     private static partial Regex ValidNamePattern();
 
+    /// <summary>
+    /// One line of "pactl list modules short": index, module name, optional arguments.
+    /// </summary>
+    [GeneratedRegex(@"^(\d+)\t([^\t\r\n]+)(?:\t([^\t\r\n]*))?", RegexOptions.Multiline)]
+    private static partial Regex ShortModuleLinePattern();
+
+    /// <summary>
+    /// One line of "pactl list sinks short": index followed by the sink name.
+    /// </summary>
+    [GeneratedRegex(@"^\d+\t([^\t\r\n]+)", RegexOptions.Multiline)]
+    private static partial Regex ShortSinkLinePattern();
+
     /// <summary>
     /// Characters that are dangerous in shell commands and must be rejected.
+    /// SearchValues gives a vectorized membership test instead of scanning a char array.
     /// </summary>
-    private static readonly char[] DangerousChars =
-        [';', '&', '|', '$', '`', '(', ')', '{', '}', '[', ']', '<', '>', '!', '\\', '"', '\'', '\n', '\r', '\0'];
+    private static readonly SearchValues<char> DangerousChars =
+        SearchValues.Create(";&|$`(){}[]<>!\\\"'\n\r\0");
 
     public PaModuleRunner(ILogger<PaModuleRunner> logger)
     {
@@ -46,7 +61,7 @@ public partial class PaModuleRunner : IPaModuleRunner
         }
 
         // Check for dangerous shell metacharacters
-        if (name.IndexOfAny(DangerousChars) >= 0)
+        if (name.AsSpan().ContainsAny(DangerousChars))
         {
             errorMessage = "Name contains invalid characters.";
             return false;
@@ -152,6 +167,9 @@ public partial class PaModuleRunner : IPaModuleRunner
             return null;
         }
 
+        // A new sink exists now; drop the cached device list
+        PulseAudioDeviceEnumerator.RefreshDevices();
+
         // Parse module index from output
         if (int.TryParse(result.Output.Trim(), out var moduleIndex))
         {
@@ -248,6 +266,9 @@ public partial class PaModuleRunner : IPaModuleRunner
             return null;
         }
 
+        // A new sink exists now; drop the cached device list
+        PulseAudioDeviceEnumerator.RefreshDevices();
+
         // Parse module index from output
         if (int.TryParse(result.Output.Trim(), out var moduleIndex))
         {
@@ -279,6 +300,7 @@ public partial class PaModuleRunner : IPaModuleRunner
 
         if (result.ExitCode == 0)
         {
+            PulseAudioDeviceEnumerator.RefreshDevices();
             _logger.LogInformation("Successfully unloaded module {Index}", moduleIndex);
             return true;
         }
@@ -315,17 +337,13 @@ public partial class PaModuleRunner : IPaModuleRunner
         }
 
         var modules = new List<PaModule>();
-        var lines = result.Output.Split('\n', StringSplitOptions.RemoveEmptyEntries);
 
-        foreach (var line in lines)
+        // Format: index\tmodule_name\targuments - one regex pass over the whole output
+        foreach (Match match in ShortModuleLinePattern().Matches(result.Output))
         {
-            // Format: index\tmodule_name\targuments
-            var parts = line.Split('\t');
-            if (parts.Length >= 2 && int.TryParse(parts[0], out var index))
+            if (int.TryParse(match.Groups[1].ValueSpan, out var index))
             {
-                var name = parts[1];
-                var args = parts.Length >= 3 ? parts[2] : "";
-                modules.Add(new PaModule(index, name, args));
+                modules.Add(new PaModule(index, match.Groups[2].Value, match.Groups[3].Value));
             }
         }
 
@@ -348,11 +366,9 @@ public partial class PaModuleRunner : IPaModuleRunner
         if (result.ExitCode != 0)
             return false;
 
-        var lines = result.Output.Split('\n', StringSplitOptions.RemoveEmptyEntries);
-        foreach (var line in lines)
+        foreach (Match match in ShortSinkLinePattern().Matches(result.Output))
         {
-            var parts = line.Split('\t');
-            if (parts.Length >= 2 && parts[1].Equals(sinkName, StringComparison.OrdinalIgnoreCase))
+            if (match.Groups[1].ValueSpan.Equals(sinkName, StringComparison.OrdinalIgnoreCase))
             {
                 return true;
             }
@@ -367,7 +383,7 @@ public partial class PaModuleRunner : IPaModuleRunner
     {
         var psi = new ProcessStartInfo
         {
-            FileName = "pactl",
+            FileName = PactlCommandRunner.PactlPath,
             RedirectStandardOutput = true,
             RedirectStandardError = true,
             UseShellExecute = false,
@@ -381,7 +397,10 @@ public partial class PaModuleRunner : IPaModuleRunner
         }
 
         using var process = new Process { StartInfo = psi };
-        var argsForLogging = string.Join(" ", arguments);
+        // Only used in debug logs - skip the join when debug logging is off
+        var argsForLogging = _logger.IsEnabled(LogLevel.Debug)
+            ? string.Join(" ", arguments)
+            : string.Empty;
 
         try
         {
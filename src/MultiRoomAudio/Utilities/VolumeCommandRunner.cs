@@ -1,5 +1,7 @@
+using System.Buffers;
 using System.Diagnostics;
 using System.Text.RegularExpressions;
+using MultiRoomAudio.Audio.PulseAudio;
 
 namespace MultiRoomAudio.Utilities;
 
@@ -17,10 +19,18 @@ public partial class VolumeCommandRunner
     [GeneratedRegex(@"^[a-zA-Z0-9_\-\.]+$", RegexOptions.Compiled)]
     private static partial Regex ValidSinkPattern();
 
+    /// <summary>
+    /// Pattern for the percentage in pactl get-sink-volume output.
+    /// </summary>
+    [GeneratedRegex(@"(\d+)%")]
+    private static partial Regex VolumePercentPattern();
+
     /// <summary>
     /// Characters that are dangerous in shell commands and must be rejected.
+    /// SearchValues gives a vectorized membership test instead of scanning a char array.
     /// </summary>
-    private static readonly char[] DangerousChars = { ';', '&', '|', '$', '`', '(', ')', '{', '}', '[', ']', '<', '>', '!', '\\', '"', '\'', '\n', '\r', '\0' };
+    private static readonly SearchValues<char> DangerousChars =
+        SearchValues.Create(";&|$`(){}[]<>!\\\"'\n\r\0");
 
     public VolumeCommandRunner(ILogger<VolumeCommandRunner> logger)
     {
@@ -44,7 +54,7 @@ public partial class VolumeCommandRunner
         }
 
         // Check for dangerous shell metacharacters
-        if (sink.IndexOfAny(DangerousChars) >= 0)
+        if (sink.AsSpan().ContainsAny(DangerousChars))
         {
             errorMessage = "Sink name contains invalid characters.";
             return false;
@@ -82,7 +92,7 @@ public partial class VolumeCommandRunner
         {
             var sinkArg = string.IsNullOrEmpty(sink) ? "@DEFAULT_SINK@" : sink;
             var result = await RunCommandAsync(
-                "pactl",
+                PactlCommandRunner.PactlPath,
                 ["get-sink-volume", sinkArg],
                 cancellationToken);
 
@@ -90,7 +100,7 @@ public partial class VolumeCommandRunner
                 return null;
 
             // Parse output like "front-left: 65536 / 100%"
-            var match = Regex.Match(result.Output, @"(\d+)%");
+            var match = VolumePercentPattern().Match(result.Output);
             if (match.Success)
             {
                 var volumePercent = int.Parse(match.Groups[1].Value);
@@ -125,7 +135,7 @@ public partial class VolumeCommandRunner
             var sinkArg = string.IsNullOrEmpty(sink) ? "@DEFAULT_SINK@" : sink;
             _logger.LogInformation("VOLUME [Hardware] Setting sink '{Sink}' to {Volume}%", sinkArg, volume);
             var result = await RunCommandAsync(
-                "pactl",
+                PactlCommandRunner.PactlPath,
                 ["set-sink-volume", sinkArg, $"{volume}%"],
                 cancellationToken);
             return result.ExitCode == 0;
@@ -153,7 +163,7 @@ public partial class VolumeCommandRunner
             var sinkArg = string.IsNullOrEmpty(sink) ? "@DEFAULT_SINK@" : sink;
             var muteArg = muted ? "1" : "0";
             var result = await RunCommandAsync(
-                "pactl",
+                PactlCommandRunner.PactlPath,
                 ["set-sink-mute", sinkArg, muteArg],
                 cancellationToken);
             return result.ExitCode == 0;
@@ -186,7 +196,10 @@ public partial class VolumeCommandRunner
         }
 
         using var process = new Process { StartInfo = psi };
-        var argsForLogging = string.Join(" ", arguments);
+        // Only used in debug logs - skip the join when debug logging is off
+        var argsForLogging = _logger.IsEnabled(LogLevel.Debug)
+            ? string.Join(" ", arguments)
+            : string.Empty;
 
         try
         {
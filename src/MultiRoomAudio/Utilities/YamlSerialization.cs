@@ -0,0 +1,31 @@
+using YamlDotNet.Serialization;
+using YamlDotNet.Serialization.NamingConventions;
+
+namespace MultiRoomAudio.Utilities;
+
+/// <summary>
+/// Shared YamlDotNet serializer and deserializer for the config files.
+/// </summary>
+/// <remarks>
+/// Built instances are thread-safe and cache per-type reflection metadata, so sharing
+/// one pair means each config type is inspected once for the whole process instead of
+/// once per service (and startup doesn't rebuild the same pipeline five times).
+/// </remarks>
+public static class YamlSerialization
+{
+    /// <summary>
+    /// Deserializer using snake_case keys and ignoring unknown properties.
+    /// </summary>
+    public static IDeserializer Deserializer { get; } = new DeserializerBuilder()
+        .WithNamingConvention(UnderscoredNamingConvention.Instance)
+        .IgnoreUnmatchedProperties()
+        .Build();
+
+    /// <summary>
+    /// Serializer using snake_case keys and omitting null values.
+    /// </summary>
+    public static ISerializer Serializer { get; } = new SerializerBuilder()
+        .WithNamingConvention(UnderscoredNamingConvention.Instance)
+        .ConfigureDefaultValuesHandling(DefaultValuesHandling.OmitNull)
+        .Build();
+}
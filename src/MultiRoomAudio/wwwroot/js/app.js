@@ -7,6 +7,16 @@ let connection = null;
 let currentBuildVersion = null; // Stored build version for comparison
 let isUserInteracting = false; // Track if user is dragging a slider
 let pendingUpdate = null; // Store pending updates during interaction
+let lastStatusAt = 0; // Timestamp of the last status push or poll
+let lastStatusSequence = null; // Sequence of the last SignalR status applied, null until a snapshot arrives
+
+// Status polling is only a fallback when SignalR pushes aren't arriving
+const STATUS_POLL_INTERVAL_MS = 5000;
+const STATUS_SAFETY_POLL_MS = 30000;
+
+// Must match the hub options in Program.cs (timeouts >= 2x the peer's keep-alive)
+const SIGNALR_KEEPALIVE_MS = 25000;
+const SIGNALR_SERVER_TIMEOUT_MS = 60000;
 
 function formatBuildVersion(apiInfo) {
     const version = apiInfo?.version;
@@ -247,8 +257,8 @@ document.addEventListener('DOMContentLoaded', async () => {
         }
     }
 
-    // Poll for status updates as fallback
-    setInterval(refreshStatus, 5000);
+    // Poll for status updates as fallback (skipped while SignalR is pushing)
+    setInterval(pollStatusFallback, STATUS_POLL_INTERVAL_MS);
 
     // Periodic version check (every 30 seconds) as fallback
     setInterval(checkVersionAndReload, 30000);
@@ -269,10 +279,18 @@ function setupSignalR() {
     connection = new signalR.HubConnectionBuilder()
         .withUrl('./hubs/status')
         .withAutomaticReconnect()
+        .withKeepAliveInterval(SIGNALR_KEEPALIVE_MS)
+        .withServerTimeout(SIGNALR_SERVER_TIMEOUT_MS)
         .build();
 
     connection.on('PlayerStatusUpdate', (data) => {
         console.log('Status update:', data);
+        lastStatusAt = Date.now();
+        // A snapshot older than what we already applied (e.g. overtaken by a resync) is stale
+        if (lastStatusSequence !== null && data.sequence < lastStatusSequence) {
+            return;
+        }
+        lastStatusSequence = data.sequence;
         if (data.players) {
             // Convert array to object keyed by name (same as refreshStatus)
             players = {};
@@ -290,7 +308,35 @@ function setupSignalR() {
         }
     });
 
+    // Between full snapshots the server only sends players that changed or were removed
+    connection.on('PlayerStatusDelta', (data) => {
+        lastStatusAt = Date.now();
+        if (lastStatusSequence !== null && data.sequence <= lastStatusSequence) {
+            return; // Already covered by a newer snapshot
+        }
+        if (lastStatusSequence === null || data.sequence !== lastStatusSequence + 1) {
+            // Missed an update, so this delta doesn't apply to what we have
+            requestFullStatus();
+            return;
+        }
+        lastStatusSequence = data.sequence;
+        (data.changed || []).forEach(p => {
+            players[p.name] = p;
+        });
+        (data.removed || []).forEach(name => {
+            delete players[name];
+        });
+
+        if (isUserInteracting) {
+            pendingUpdate = { players: { ...players } };
+        } else {
+            renderPlayers();
+        }
+    });
+
     connection.onreconnecting(() => {
+        // The server may have restarted; take whatever snapshot the new connection sends
+        lastStatusSequence = null;
         statusBadge.textContent = 'Reconnecting...';
         statusBadge.className = 'badge bg-warning me-2';
     });
@@ -320,6 +366,23 @@ function setupSignalR() {
         });
 }
 
+// Ask the hub for a full snapshot after a missed delta, falling back to the REST endpoint
+function requestFullStatus() {
+    connection.invoke('RequestStatus').catch(err => {
+        console.log('RequestStatus failed, refreshing over HTTP:', err);
+        refreshStatus();
+    });
+}
+
+// Poll only when SignalR is down, plus an occasional safety-net refresh
+function pollStatusFallback() {
+    const connected = connection && connection.state === signalR.HubConnectionState.Connected;
+    if (connected && Date.now() - lastStatusAt < STATUS_SAFETY_POLL_MS) {
+        return;
+    }
+    refreshStatus();
+}
+
 // API calls
 async function refreshStatus() {
     try {
@@ -327,6 +390,7 @@ async function refreshStatus() {
         if (!response.ok) throw new Error('Failed to fetch players');
 
         const data = await response.json();
+        lastStatusAt = Date.now();
         players = {};
         (data.players || []).forEach(p => {
             players[p.name] = p;
@@ -2542,6 +2606,8 @@ function setupLogsSignalR() {
     logsConnection = new signalR.HubConnectionBuilder()
         .withUrl('./hubs/logs')
         .withAutomaticReconnect()
+        .withKeepAliveInterval(SIGNALR_KEEPALIVE_MS)
+        .withServerTimeout(SIGNALR_SERVER_TIMEOUT_MS)
         .build();
 
     logsConnection.on('LogEntry', (entry) => {